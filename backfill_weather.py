@@ -9,18 +9,27 @@ Usage:
     uv run python backfill_weather.py
 """
 
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import requests
-from dateutil import tz
+from requests.adapters import HTTPAdapter
+
+import fastjson
 
 PROJECT_ROOT = Path(__file__).parent
 CONFIG_PATH = PROJECT_ROOT / "config.json"
 SIGHTINGS_PATH = PROJECT_ROOT / "data" / "sightings.json"
 
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+
+# Keep-alive session shared by all calls; the pool holds one connection
+# per Open-Meteo host so the two range fetches can overlap
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
 # Weather code mapping (WMO codes)
 WEATHER_CODES = {
     0: "Clear sky",
@@ -43,75 +52,77 @@ WEATHER_CODES = {
     99: "Thunderstorm with heavy hail",
 }
 
+# Dense tuple LUT over the 0-99 WMO code space - indexing replaces a
+# dict hash+probe per day in the range fetch
+_WC = tuple(WEATHER_CODES.get(i, "Unknown") for i in range(100))
+
+DAILY_PARAMS = [
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "precipitation_sum",
+    "weather_code",
+    "relative_humidity_2m_mean",
+    "pressure_msl_mean",
+    "wind_speed_10m_max",
+    "wind_direction_10m_dominant",
+    "soil_temperature_0_to_7cm_mean",
+    "uv_index_max",
+]
+
 
 def load_config():
-    with open(CONFIG_PATH) as f:
-        return json.load(f)
+    return fastjson.loads(CONFIG_PATH.read_bytes())
 
 
 def load_sightings():
-    with open(SIGHTINGS_PATH) as f:
-        return json.load(f)
+    return fastjson.loads(SIGHTINGS_PATH.read_bytes())
 
 
 def save_sightings(sightings):
-    with open(SIGHTINGS_PATH, "w") as f:
-        json.dump(sightings, f, indent=2, ensure_ascii=False)
+    SIGHTINGS_PATH.write_bytes(fastjson.dumps(sightings, indent=True))
 
 
-def fetch_weather(lat, lon, date, timezone_str):
-    """Fetch extended weather data from Open-Meteo API"""
-    date_str = date.strftime("%Y-%m-%d")
-    today = datetime.now().date()
-    target_date = date.date()
-
-    # Choose API based on date
-    if (today - target_date).days <= 7:
-        base_url = "https://api.open-meteo.com/v1/forecast"
-    else:
-        base_url = "https://archive-api.open-meteo.com/v1/archive"
-
-    daily_params = [
-        "temperature_2m_max",
-        "temperature_2m_min",
-        "precipitation_sum",
-        "weather_code",
-        "relative_humidity_2m_mean",
-        "pressure_msl_mean",
-        "wind_speed_10m_max",
-        "wind_direction_10m_dominant",
-        "soil_temperature_0_to_7cm_mean",
-        "uv_index_max",
-    ]
+def fetch_weather_range(lat, lon, start_date, end_date, timezone_str, base_url):
+    """Fetch daily weather for an inclusive date range in one request.
 
+    The Open-Meteo daily response is arrays indexed by day, so a whole
+    range costs the same round-trip as a single date. Returns a dict
+    mapping date string (YYYY-MM-DD) to a weather dict.
+    """
     params = {
         "latitude": lat,
         "longitude": lon,
-        "start_date": date_str,
-        "end_date": date_str,
-        "daily": ",".join(daily_params),
+        "start_date": start_date,
+        "end_date": end_date,
+        "daily": ",".join(DAILY_PARAMS),
         "timezone": timezone_str,
     }
 
-    response = requests.get(base_url, params=params, timeout=10)
+    response = SESSION.get(base_url, params=params, timeout=30)
     response.raise_for_status()
-    data = response.json()
-
-    daily = data.get("daily", {})
-    weather_code = daily.get("weather_code", [0])[0] or 0
-
-    return {
-        "temp_max_c": daily.get("temperature_2m_max", [None])[0],
-        "temp_min_c": daily.get("temperature_2m_min", [None])[0],
-        "precipitation_mm": daily.get("precipitation_sum", [0])[0] or 0,
-        "conditions": WEATHER_CODES.get(weather_code, "Unknown"),
-        "humidity_percent": daily.get("relative_humidity_2m_mean", [None])[0],
-        "pressure_hpa": daily.get("pressure_msl_mean", [None])[0],
-        "wind_speed_kmh": daily.get("wind_speed_10m_max", [None])[0],
-        "wind_direction_deg": daily.get("wind_direction_10m_dominant", [None])[0],
-        "soil_temp_c": daily.get("soil_temperature_0_to_7cm_mean", [None])[0],
-        "uv_index": daily.get("uv_index_max", [None])[0],
-    }
+    daily = response.json().get("daily", {})
+
+    def column(key, i):
+        values = daily.get(key)
+        return values[i] if values and i < len(values) else None
+
+    weather_by_date = {}
+    for i, date_str in enumerate(daily.get("time", [])):
+        weather_code = column("weather_code", i) or 0
+        weather_by_date[date_str] = {
+            "temp_max_c": column("temperature_2m_max", i),
+            "temp_min_c": column("temperature_2m_min", i),
+            "precipitation_mm": column("precipitation_sum", i) or 0,
+            "conditions": _WC[weather_code] if 0 <= weather_code < 100 else "Unknown",
+            "humidity_percent": column("relative_humidity_2m_mean", i),
+            "pressure_hpa": column("pressure_msl_mean", i),
+            "wind_speed_kmh": column("wind_speed_10m_max", i),
+            "wind_direction_deg": column("wind_direction_10m_dominant", i),
+            "soil_temp_c": column("soil_temperature_0_to_7cm_mean", i),
+            "uv_index": column("uv_index_max", i),
+        }
+
+    return weather_by_date
 
 
 def main():
@@ -121,7 +132,6 @@ def main():
     lat = config["location"]["latitude"]
     lon = config["location"]["longitude"]
     timezone_str = config["location"]["timezone"]
-    local_tz = tz.gettz(timezone_str)
 
     # Find sightings that need weather backfill
     to_update = []
@@ -138,27 +148,52 @@ def main():
     print(f"Found {len(to_update)} sighting(s) to update")
     print()
 
+    # Split dates between the forecast API (last 7 days) and the archive
+    # API, then fetch each side's full range in a single request
+    today = datetime.now().date()
+    recent_dates = set()
+    older_dates = set()
+    for idx in to_update:
+        date_str = sightings[idx]["captured_at"][:10]
+        target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        if (today - target_date).days <= 7:
+            recent_dates.add(date_str)
+        else:
+            older_dates.add(date_str)
+
+    fetches = []
+    if older_dates:
+        print(f"Fetching archive weather for {min(older_dates)}..{max(older_dates)}...")
+        fetches.append((min(older_dates), max(older_dates), ARCHIVE_URL))
+    if recent_dates:
+        print(f"Fetching recent weather for {min(recent_dates)}..{max(recent_dates)}...")
+        fetches.append((min(recent_dates), max(recent_dates), FORECAST_URL))
+
+    # The archive and forecast hosts are independent, so overlap the two
+    # round-trips when both are needed
+    weather_by_date = {}
+    try:
+        with ThreadPoolExecutor(max_workers=len(fetches)) as pool:
+            futures = [
+                pool.submit(fetch_weather_range, lat, lon, start, end, timezone_str, url)
+                for start, end, url in fetches
+            ]
+            for future in futures:
+                weather_by_date.update(future.result())
+    except Exception as e:
+        print(f"Weather fetch failed: {e}")
+        return
+
     updated = 0
     for idx in to_update:
         s = sightings[idx]
-        try:
-            captured_at = datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00"))
-            if captured_at.tzinfo is None:
-                captured_at = captured_at.replace(tzinfo=local_tz)
-
-            print(f"Fetching weather for {s['id']} ({s['common_name']})...", end=" ")
-
-            weather = fetch_weather(lat, lon, captured_at, timezone_str)
+        weather = weather_by_date.get(s["captured_at"][:10])
+        if weather:
             sightings[idx]["weather"] = weather
-
-            print(f"OK (humidity: {weather.get('humidity_percent')}%)")
+            print(f"{s['id']} ({s['common_name']}): OK (humidity: {weather.get('humidity_percent')}%)")
             updated += 1
-
-            # Be nice to the API - wait 0.5 seconds between requests
-            time.sleep(0.5)
-
-        except Exception as e:
-            print(f"FAILED: {e}")
+        else:
+            print(f"{s['id']} ({s['common_name']}): FAILED (no data for date)")
 
     save_sightings(sightings)
     print(f"\nUpdated {updated} sighting(s)")
@@ -9,19 +9,26 @@ Commands:
 """
 
 import argparse
+import bisect
+import functools
 import http.server
-import json
 import os
+import pickle
+import re
 import shutil
-import socketserver
+import socket
+import threading
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import ephem
 import markdown
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
+import fastjson
 from taxonomy import fetch_all_taxonomy, build_species_tree, get_species_stats
 from collections import defaultdict
 
@@ -41,28 +48,73 @@ TEMPLATES_PATH = PROJECT_ROOT / "templates"
 STATIC_PATH = PROJECT_ROOT / "static"
 CATALOG_PATH = PROJECT_ROOT / "catalog"
 DEFAULT_OUTPUT = PROJECT_ROOT / "site"
+JINJA_CACHE_PATH = PROJECT_ROOT / ".jinja_cache"
+
+# Month abbreviations indexed by month-1, for building "%b %Y" style labels
+# from ISO timestamp slices without constructing datetime objects
+MONTH_ABBREVS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                 "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Below this many pages the process-pool startup costs more than it saves
+PARALLEL_RENDER_MIN = 16
+
+# Frontmatter is YAML-lite: "key: value" lines, values optionally quoted,
+# list values in [brackets] with optionally-quoted comma-separated items
+_FRONTMATTER_RE = re.compile(r"^([\w-]+):[ \t]*(.*?)[ \t]*$", re.M)
+_FM_LIST_ITEM_RE = re.compile(r'"([^"]*)"|\'([^\']*)\'|([^,\[\]\s][^,\[\]]*)')
+
+
+def _cached_json_load(path: Path):
+    """Load JSON from path, using an mtime+size keyed pickle sidecar.
+
+    Unpickling skips JSON tokenization entirely, so repeat builds where
+    the data files haven't changed reload them several times faster.
+    The sidecar (e.g. sightings.json.pkl) is rewritten atomically
+    whenever the source file changes.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cache_path = path.with_name(path.name + ".pkl")
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, data = pickle.load(f)
+            if cached_key == key:
+                return data
+        except Exception:
+            pass  # Corrupt/stale cache - fall through to re-parse
+
+    data = fastjson.loads(path.read_bytes())
+
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, data), f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache write failure is non-fatal
+
+    return data
 
 
 def load_config() -> dict:
     """Load configuration from config.json"""
-    with open(CONFIG_PATH) as f:
-        return json.load(f)
+    return _cached_json_load(CONFIG_PATH)
 
 
 def load_sightings() -> list:
     """Load all sightings from sightings.json"""
     if not SIGHTINGS_PATH.exists():
         return []
-    with open(SIGHTINGS_PATH) as f:
-        return json.load(f)
+    return _cached_json_load(SIGHTINGS_PATH)
 
 
 def load_observations() -> list:
     """Load all quick observations from observations.json"""
     if not OBSERVATIONS_PATH.exists():
         return []
-    with open(OBSERVATIONS_PATH) as f:
-        return json.load(f)
+    return _cached_json_load(OBSERVATIONS_PATH)
 
 
 def load_posts() -> list:
@@ -75,20 +127,20 @@ def load_posts() -> list:
         with open(md_file) as f:
             content = f.read()
 
-        # Parse frontmatter
+        # Parse frontmatter (single compiled-regex scan per block)
         if content.startswith("---"):
             parts = content.split("---", 2)
             if len(parts) >= 3:
                 frontmatter = {}
-                for line in parts[1].strip().split("\n"):
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        # Handle list values
-                        if value.startswith("[") and value.endswith("]"):
-                            value = [v.strip().strip('"').strip("'") for v in value[1:-1].split(",")]
-                        frontmatter[key] = value
+                for key, value in _FRONTMATTER_RE.findall(parts[1]):
+                    # Handle list values
+                    if value.startswith("[") and value.endswith("]"):
+                        frontmatter[key] = [
+                            dq or sq or bare.strip()
+                            for dq, sq, bare in _FM_LIST_ITEM_RE.findall(value[1:-1])
+                        ]
+                    else:
+                        frontmatter[key] = value.strip("'\"")
                 body = parts[2].strip()
             else:
                 frontmatter = {}
@@ -307,12 +359,15 @@ def compute_stats(sightings: list, observations: list, config: dict) -> dict:
     stats = {}
 
     now = datetime.now()
+    current_month = now.strftime("%Y-%m")
+
+    # Sort once - discovery curve and first-by-category need chronological order
+    sorted_sightings = sorted(sightings, key=lambda s: s["captured_at"])
 
     # Project start date: use first sighting date, or today if no sightings
-    if sightings:
-        first_sighting_date = min(
-            datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00"))
-            for s in sightings
+    if sorted_sightings:
+        first_sighting_date = datetime.fromisoformat(
+            sorted_sightings[0]["captured_at"].replace("Z", "+00:00")
         )
         project_start = datetime(first_sighting_date.year, first_sighting_date.month, first_sighting_date.day)
     else:
@@ -323,55 +378,128 @@ def compute_stats(sightings: list, observations: list, config: dict) -> dict:
     stats["total_observations"] = len(observations)
     stats["generated_at"] = now.strftime("%B %d, %Y")
 
-    # Unique species (by scientific_name) - from sightings only (observations don't have scientific names)
-    scientific_names = set(s["scientific_name"].lower() for s in sightings if s.get("scientific_name"))
-    stats["unique_species"] = len(scientific_names)
-
     # Days elapsed since project start
     stats["days_elapsed"] = max(1, (now - project_start).days + 1)
 
-    # Days with sightings or observations (documented days)
+    # Accumulators - all filled in a single pass over each list below
     documented_dates = set()
-    for s in sightings:
+    scientific_names = set()
+    species_by_category = {}
+    by_season = Counter()
+    month_counts = Counter()
+    species_before_this_month = set()
+    species_this_month = set()
+    seen_species = set()
+    discovery_curve = OrderedDict()
+    by_weather = Counter()
+    by_moon = Counter()
+    name_display = {}  # lowercase -> display name (sighting names preferred)
+    species_counts = Counter()
+    first_by_category = {}
+
+    # Single pass over sightings (chronological), parsing each timestamp once
+    for s in sorted_sightings:
+        sci_name = s.get("scientific_name", "").lower()
+        if sci_name:
+            scientific_names.add(sci_name)
+
+            cat = s["category"]
+            if cat not in species_by_category:
+                species_by_category[cat] = set()
+            species_by_category[cat].add(sci_name)
+
+        by_season[s.get("season", "unknown")] += 1
+
+        condition = s.get("weather", {}).get("conditions", "Unknown")
+        if condition:
+            by_weather[condition] += 1
+
+        phase = s.get("celestial", {}).get("moon_phase", "Unknown")
+        if phase:
+            by_moon[phase] += 1
+
+        name = s["common_name"]
+        key = name.lower()
+        name_display[key] = name
+        species_counts[key] += 1
+
+        # captured_at is known-ISO (YYYY-MM-DDThh:mm:ss...) so slicing is
+        # enough here - no need to build a datetime per record
+        ts = s.get("captured_at", "")
         try:
-            dt = datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00"))
-            documented_dates.add(dt.date())
-        except:
-            pass
+            month_label = MONTH_ABBREVS[int(ts[5:7]) - 1]
+        except (ValueError, IndexError):
+            continue
+
+        documented_dates.add(ts[:10])
+
+        ym_key = ts[:7]
+        month_counts[ym_key] += 1
+
+        if sci_name:
+            if ym_key < current_month:
+                species_before_this_month.add(sci_name)
+            elif ym_key == current_month:
+                species_this_month.add(sci_name)
+
+            seen_species.add(sci_name)
+            discovery_curve[f"{month_label} {ts[:4]}"] = len(seen_species)
+
+        cat = s["category"]
+        if cat not in first_by_category:
+            first_by_category[cat] = {
+                "id": s["id"],
+                "name": s["common_name"],
+                "date": f"{month_label} {ts[8:10]}, {ts[:4]}",
+            }
+
+    # Single pass over observations
     for o in observations:
+        sci_name = o.get("scientific_name", "").lower()
+        date_str = o.get("date", "")
+        if sci_name:
+            if date_str[:7] < current_month:
+                species_before_this_month.add(sci_name)
+            elif date_str[:7] == current_month:
+                species_this_month.add(sci_name)
+
+        condition = o.get("weather", {}).get("conditions")
+        if condition:
+            by_weather[condition] += 1
+
+        phase = o.get("celestial", {}).get("moon_phase")
+        if phase:
+            by_moon[phase] += 1
+
+        name = o["common_name"]
+        key = name.lower()
+        if key not in name_display:
+            name_display[key] = name
+        species_counts[key] += 1
+
         try:
-            documented_dates.add(datetime.strptime(o["date"], "%Y-%m-%d").date())
-        except:
-            pass
+            month = int(date_str[5:7])
+        except ValueError:
+            continue
+
+        documented_dates.add(date_str[:10])
+        by_season[get_season_from_month(month)] += 1
+        month_counts[date_str[:7]] += 1
+
+    # Unique species (by scientific_name) - from sightings only
+    stats["unique_species"] = len(scientific_names)
+
+    # Days with sightings or observations (documented days)
     stats["days_with_sightings"] = len(documented_dates)
     stats["days_documented"] = len(documented_dates)
     stats["days_without_sightings"] = stats["days_elapsed"] - len(documented_dates)
     stats["coverage_percent"] = round(len(documented_dates) / stats["days_elapsed"] * 100)
 
     # Unique species by category (using scientific name)
-    species_by_category = {}
-    for s in sightings:
-        cat = s["category"]
-        sci_name = s.get("scientific_name", "").lower()
-        if not sci_name:
-            continue
-        if cat not in species_by_category:
-            species_by_category[cat] = set()
-        species_by_category[cat].add(sci_name)
     by_category = {cat: len(species) for cat, species in species_by_category.items()}
     stats["by_category"] = dict(sorted(by_category.items(), key=lambda x: -x[1]))
     stats["max_category"] = max(by_category.values()) if by_category else 1
 
-    # By season (sightings + observations)
-    by_season = Counter(s.get("season", "unknown") for s in sightings)
-    # Add observations (infer season from date)
-    for o in observations:
-        try:
-            dt = datetime.strptime(o["date"], "%Y-%m-%d")
-            season = get_season_from_month(dt.month)
-            by_season[season] += 1
-        except:
-            pass
     # Order seasons logically
     season_order = ["winter", "summer", "monsoon", "post-monsoon"]
     stats["by_season"] = OrderedDict()
@@ -379,172 +507,149 @@ def compute_stats(sightings: list, observations: list, config: dict) -> dict:
         stats["by_season"][season] = by_season.get(season, 0)
     stats["max_season"] = max(by_season.values()) if by_season else 1
 
-    # By month (sightings + observations)
-    month_counts = Counter()
-    for s in sightings:
-        try:
-            dt = datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00"))
-            month_key = dt.strftime("%b %Y")
-            month_counts[month_key] += 1
-        except:
-            pass
-    # Add observations
-    for o in observations:
-        try:
-            dt = datetime.strptime(o["date"], "%Y-%m-%d")
-            month_key = dt.strftime("%b %Y")
-            month_counts[month_key] += 1
-        except:
-            pass
-    # Sort by date
-    def month_sort_key(m):
-        try:
-            return datetime.strptime(m, "%b %Y")
-        except:
-            return datetime.min
-    sorted_months = sorted(month_counts.keys(), key=month_sort_key)
-    stats["by_month"] = OrderedDict((m, month_counts[m]) for m in sorted_months)
+    # By month, sorted by date - keys are YYYY-MM so plain string sort works
+    stats["by_month"] = OrderedDict(
+        (f"{MONTH_ABBREVS[int(ym[5:7]) - 1]} {ym[:4]}", month_counts[ym])
+        for ym in sorted(month_counts)
+    )
     stats["max_month"] = max(month_counts.values()) if month_counts else 1
 
-    # This month stats - NEW species discovered this month (not seen before)
-    current_month = now.strftime("%Y-%m")
-
-    # First, collect all species seen before this month
-    species_before_this_month = set()
-    for s in sightings:
-        try:
-            dt = datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00"))
-            if dt.strftime("%Y-%m") < current_month:
-                sci_name = s.get("scientific_name", "").lower()
-                if sci_name:
-                    species_before_this_month.add(sci_name)
-        except:
-            pass
-    for o in observations:
-        try:
-            if o["date"][:7] < current_month:
-                sci_name = o.get("scientific_name", "").lower()
-                if sci_name:
-                    species_before_this_month.add(sci_name)
-        except:
-            pass
-
-    # Now find species seen this month that are NEW
-    species_this_month = set()
-    for s in sightings:
-        try:
-            dt = datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00"))
-            if dt.strftime("%Y-%m") == current_month:
-                sci_name = s.get("scientific_name", "").lower()
-                if sci_name:
-                    species_this_month.add(sci_name)
-        except:
-            pass
-    for o in observations:
-        try:
-            if o["date"][:7] == current_month:
-                sci_name = o.get("scientific_name", "").lower()
-                if sci_name:
-                    species_this_month.add(sci_name)
-        except:
-            pass
-
+    # NEW species discovered this month (not seen before)
     new_species_this_month = species_this_month - species_before_this_month
     stats["unique_species_this_month"] = len(new_species_this_month)
 
-    # Discovery curve (cumulative unique species by month - using scientific name)
-    seen_species = set()
-    discovery_curve = OrderedDict()
-    for s in sorted(sightings, key=lambda x: x["captured_at"]):
-        try:
-            sci_name = s.get("scientific_name", "").lower()
-            if not sci_name:
-                continue
-            dt = datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00"))
-            month_key = dt.strftime("%b %Y")
-            seen_species.add(sci_name)
-            discovery_curve[month_key] = len(seen_species)
-        except:
-            pass
+    # Discovery curve (cumulative unique species by month)
     stats["discovery_curve"] = discovery_curve
     stats["max_discovery"] = max(discovery_curve.values()) if discovery_curve else 1
 
-    # By weather condition (sightings + observations)
-    by_weather = Counter()
-    for s in sightings:
-        weather = s.get("weather", {})
-        condition = weather.get("conditions", "Unknown")
-        if condition:
-            by_weather[condition] += 1
-    for o in observations:
-        weather = o.get("weather", {})
-        condition = weather.get("conditions")
-        if condition:
-            by_weather[condition] += 1
     stats["by_weather"] = dict(sorted(by_weather.items(), key=lambda x: -x[1]))
     stats["max_weather"] = max(by_weather.values()) if by_weather else 1
 
-    # By moon phase (sightings + observations)
-    by_moon = Counter()
-    for s in sightings:
-        celestial = s.get("celestial", {})
-        phase = celestial.get("moon_phase", "Unknown")
-        if phase:
-            by_moon[phase] += 1
-    for o in observations:
-        celestial = o.get("celestial", {})
-        phase = celestial.get("moon_phase")
-        if phase:
-            by_moon[phase] += 1
     stats["by_moon_phase"] = dict(sorted(by_moon.items(), key=lambda x: -x[1]))
     stats["max_moon"] = max(by_moon.values()) if by_moon else 1
 
     # Count total days per moon phase since project start
-    moon_phase_days = count_moon_phase_days(project_start, now)
-    stats["moon_phase_days"] = moon_phase_days
+    stats["moon_phase_days"] = count_moon_phase_days(project_start, now)
 
-    # Top species (most frequently seen) - combine sightings + observations
-    # Use lowercase for counting, but preserve display name
-    name_display = {}  # lowercase -> display name
-    species_counts = Counter()
-    for s in sightings:
-        name = s["common_name"]
-        key = name.lower()
-        name_display[key] = name  # prefer sighting names (title case)
-        species_counts[key] += 1
-    for o in observations:
-        name = o["common_name"]
-        key = name.lower()
-        if key not in name_display:
-            name_display[key] = name
-        species_counts[key] += 1
-    # Convert back to display names
+    # Top species (most frequently seen) - display names, counted case-insensitively
     stats["top_species"] = [(name_display[k], count) for k, count in species_counts.most_common(5)]
 
     # Single-sighting species (rare finds) - species seen only once total
     stats["single_sighting_species"] = [
-        name for name, count in species_counts.items() if count == 1
+        name_display[k] for k, count in species_counts.items() if count == 1
     ]
 
-    # First sighting by category
-    first_by_category = {}
-    for s in sorted(sightings, key=lambda x: x["captured_at"]):
-        cat = s["category"]
-        if cat not in first_by_category:
-            try:
-                dt = datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00"))
-                first_by_category[cat] = {
-                    "id": s["id"],
-                    "name": s["common_name"],
-                    "date": dt.strftime("%b %d, %Y"),
-                }
-            except:
-                pass
     stats["first_by_category"] = first_by_category
 
     return stats
 
 
+def _fast_clone(src: str, dst: str) -> None:
+    """Clone a file as cheaply as the filesystem allows.
+
+    Tries a hardlink first (an inode-table write, zero bytes moved),
+    then an in-kernel copy via os.copy_file_range (reflink on
+    supporting filesystems), and only falls back to a userspace copy
+    when neither works (e.g. cross-device).
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+
+    shutil.copyfile(src, dst)
+
+
+def make_env() -> Environment:
+    """Create the Jinja2 environment with the project's custom filters.
+
+    Compiled templates are cached under .jinja_cache/ so incremental
+    rebuilds skip the Jinja lex+parse step for unchanged templates.
+    """
+    JINJA_CACHE_PATH.mkdir(exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_PATH),
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE_PATH)),
+        auto_reload=False,
+    )
+    env.filters["date"] = format_date
+    env.filters["short_date"] = format_short_date
+    env.filters["size_category"] = size_category
+    return env
+
+
+# Per-worker render state, set up once by _init_render_worker so each
+# render job doesn't have to re-pickle the (large) shared context
+_render_env = None
+_render_context = None
+
+
+def _init_render_worker(base_context: dict) -> None:
+    global _render_env, _render_context
+    _render_env = make_env()
+    _render_context = base_context
+
+
+def _render_pages(template_name: str, jobs: list) -> None:
+    """Render template_name once per (output_path, extra_context) job.
+
+    Pages stream straight to the output file as Jinja produces chunks,
+    so the full HTML string is never materialized (and never re-encoded)
+    in memory.
+    """
+    template = _render_env.get_template(template_name)
+    for out_path, extra in jobs:
+        with open(out_path, "wb") as f:
+            template.stream({**_render_context, **extra}).dump(f, encoding="utf-8")
+
+
+def render_page_jobs(base_context: dict, job_groups: list) -> None:
+    """
+    Render groups of (template_name, jobs) pages, in parallel when there
+    are enough of them.
+
+    Page renders are independent, so for larger sites they're spread
+    across a ProcessPoolExecutor (one Jinja environment per worker);
+    small sites render inline to skip process startup.
+    """
+    total = sum(len(jobs) for _, jobs in job_groups)
+    workers = os.cpu_count() or 1
+
+    if total < PARALLEL_RENDER_MIN or workers < 2:
+        _init_render_worker(base_context)
+        for template_name, jobs in job_groups:
+            _render_pages(template_name, jobs)
+        return
+
+    chunk_size = max(1, -(-total // workers))  # ceil division
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_render_worker,
+        initargs=(base_context,),
+    ) as pool:
+        futures = []
+        for template_name, jobs in job_groups:
+            for i in range(0, len(jobs), chunk_size):
+                futures.append(pool.submit(_render_pages, template_name, jobs[i:i + chunk_size]))
+        for future in futures:
+            future.result()
+
+
 def build_site(output_path: Path):
     """Build the complete static site"""
     config = load_config()
@@ -559,19 +664,15 @@ def build_site(output_path: Path):
     sightings_by_id = {s["id"]: s for s in sightings}
 
     # Setup Jinja2
-    env = Environment(loader=FileSystemLoader(TEMPLATES_PATH))
-    env.filters["date"] = format_date
-    env.filters["short_date"] = format_short_date
-    env.filters["size_category"] = size_category
-
-    # Clean and create output directories
-    if output_path.exists():
-        for item in output_path.iterdir():
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                item.unlink()
-    output_path.mkdir(parents=True, exist_ok=True)
+    env = make_env()
+
+    # Build into a fresh staging directory and atomically swap it over
+    # output_path at the end. Two renames replace the O(N) per-file
+    # cleanup, and a --serve'd site is never seen half-built.
+    final_output = output_path
+    output_path = final_output.parent / (final_output.name + ".new")
+    shutil.rmtree(output_path, ignore_errors=True)
+    output_path.mkdir(parents=True)
     (output_path / "posts").mkdir(exist_ok=True)
     (output_path / "sightings").mkdir(exist_ok=True)
     (output_path / "css").mkdir(exist_ok=True)
@@ -581,36 +682,38 @@ def build_site(output_path: Path):
     (output_path / "images" / "full").mkdir(exist_ok=True)
     (output_path / "data").mkdir(exist_ok=True)
 
-    # Copy static assets
+    # Copy static assets (hardlink/clone via _fast_clone; os.scandir
+    # avoids building a Path object per file)
     if (STATIC_PATH / "css").exists():
-        for css_file in (STATIC_PATH / "css").glob("*"):
-            shutil.copy(css_file, output_path / "css" / css_file.name)
+        for entry in os.scandir(STATIC_PATH / "css"):
+            _fast_clone(entry.path, str(output_path / "css" / entry.name))
 
     if (STATIC_PATH / "images").exists():
-        for img_file in (STATIC_PATH / "images").glob("*"):
-            if img_file.is_file():
-                shutil.copy(img_file, output_path / "images" / img_file.name)
+        for entry in os.scandir(STATIC_PATH / "images"):
+            if entry.is_file():
+                _fast_clone(entry.path, str(output_path / "images" / entry.name))
 
     # Copy footer images
     if (STATIC_PATH / "images" / "footer").exists():
         (output_path / "images" / "footer").mkdir(exist_ok=True)
-        for img_file in (STATIC_PATH / "images" / "footer").glob("*.png"):
-            shutil.copy(img_file, output_path / "images" / "footer" / img_file.name)
+        for entry in os.scandir(STATIC_PATH / "images" / "footer"):
+            if entry.name.endswith(".png"):
+                _fast_clone(entry.path, str(output_path / "images" / "footer" / entry.name))
 
     # Copy CNAME if exists (for GitHub Pages custom domain)
     if (STATIC_PATH / "CNAME").exists():
-        shutil.copy(STATIC_PATH / "CNAME", output_path / "CNAME")
+        _fast_clone(str(STATIC_PATH / "CNAME"), str(output_path / "CNAME"))
 
     # Copy favicon if exists
     if (STATIC_PATH / "favicon.ico").exists():
-        shutil.copy(STATIC_PATH / "favicon.ico", output_path / "favicon.ico")
+        _fast_clone(str(STATIC_PATH / "favicon.ico"), str(output_path / "favicon.ico"))
 
     # Copy catalog images
     for size in ["thumb", "web", "full"]:
         src_dir = CATALOG_PATH / size
         if src_dir.exists():
-            for img_file in src_dir.glob("*"):
-                shutil.copy(img_file, output_path / "images" / size / img_file.name)
+            for entry in os.scandir(src_dir):
+                _fast_clone(entry.path, str(output_path / "images" / size / entry.name))
 
     # Common template context
     # Use R2 for images if configured, otherwise local paths
@@ -628,16 +731,19 @@ def build_site(output_path: Path):
     # Generate index.html
     template = env.get_template("index.html")
 
-    # Get featured sightings from config
+    # Get featured sightings from config, preserving the configured order
     featured_ids = config.get("featured_sightings", [])
-    featured_sightings = [sightings_by_id[sid] for sid in featured_ids if sid in sightings_by_id]
+    featured_pos = {sid: i for i, sid in enumerate(featured_ids)}
+    featured_sightings = sorted(
+        (s for s in sightings if s["id"] in featured_pos),
+        key=lambda s: featured_pos[s["id"]],
+    )
 
     # Calculate days elapsed and unique species for status banner
     if sightings:
-        first_date = min(
-            datetime.fromisoformat(s["captured_at"].replace("Z", "+00:00")).date()
-            for s in sightings
-        )
+        first_date = datetime.strptime(
+            min(s["captured_at"][:10] for s in sightings), "%Y-%m-%d"
+        ).date()
         days_elapsed = max(1, (datetime.now().date() - first_date).days + 1)
     else:
         days_elapsed = 1
@@ -645,58 +751,65 @@ def build_site(output_path: Path):
     # Unique species by scientific name (from sightings only)
     unique_species = len(set(s["scientific_name"].lower() for s in sightings if s.get("scientific_name")))
 
-    html = template.render(
+    html = template.render({
         **base_context,
-        featured_sightings=featured_sightings,
-        latest_sightings=sightings[:6],
-        days_elapsed=days_elapsed,
-        unique_species=unique_species,
-    )
+        "featured_sightings": featured_sightings,
+        "latest_sightings": sightings[:6],
+        "days_elapsed": days_elapsed,
+        "unique_species": unique_species,
+    })
     (output_path / "index.html").write_text(html)
 
     # Generate about.html
     template = env.get_template("about.html")
-    html = template.render(**base_context)
+    html = template.render(base_context)
     (output_path / "about.html").write_text(html)
 
     # Generate colophon.html
     template = env.get_template("colophon.html")
-    html = template.render(**base_context)
+    html = template.render(base_context)
     (output_path / "colophon.html").write_text(html)
 
     # Generate rules.html
     template = env.get_template("rules.html")
-    html = template.render(**base_context)
+    html = template.render(base_context)
     (output_path / "rules.html").write_text(html)
 
     # Generate moon-phases.html
     template = env.get_template("moon-phases.html")
-    html = template.render(**base_context)
+    html = template.render(base_context)
     (output_path / "moon-phases.html").write_text(html)
 
     # Generate highlights.html
     highlight_ids = config.get("highlight_sightings", [])
     highlight_sightings = [sightings_by_id[sid] for sid in highlight_ids if sid in sightings_by_id]
     template = env.get_template("highlights.html")
-    html = template.render(**base_context, highlight_sightings=highlight_sightings)
+    html = template.render({**base_context, "highlight_sightings": highlight_sightings})
     (output_path / "highlights.html").write_text(html)
 
     # Generate browse.html
     template = env.get_template("browse.html")
-    html = template.render(**base_context)
+    html = template.render(base_context)
     (output_path / "browse.html").write_text(html)
 
     # Generate posts/index.html
     template = env.get_template("posts_index.html")
-    html = template.render(**base_context)
+    html = template.render(base_context)
     (output_path / "posts" / "index.html").write_text(html)
 
-    # Generate individual post pages
-    template = env.get_template("post.html")
+    # Build render jobs for individual post pages
+    # (post fields are fully computed first so workers see final state)
 
     # Sort posts by date for determining date ranges
     sorted_posts = sorted(posts, key=lambda p: p["date"])
+    post_order = {p["slug"]: i for i, p in enumerate(sorted_posts)}
 
+    # Ascending copy of the sightings list plus parallel date keys, so
+    # each post's date range is a bisect instead of a full scan
+    sightings_asc = list(reversed(sightings))
+    sighting_dates_asc = [s["captured_at"][:10] for s in sightings_asc]
+
+    post_jobs = []
     for idx, post in enumerate(posts):
         # Determine cover_image_url based on path
         cover_image = post.get("cover_image", "")
@@ -721,35 +834,30 @@ def build_site(output_path: Path):
             # Auto-populate: find sightings between previous post date and this post date
             post_date = post["date"]
             # Find previous post date
-            post_idx_sorted = next((i for i, p in enumerate(sorted_posts) if p["slug"] == post["slug"]), 0)
+            post_idx_sorted = post_order.get(post["slug"], 0)
             if post_idx_sorted > 0:
                 prev_post_date = sorted_posts[post_idx_sorted - 1]["date"]
             else:
                 prev_post_date = "1900-01-01"  # Include all sightings before first post
 
-            # Get sightings in date range (after prev_post_date, up to and including post_date)
-            for s in sightings:
-                sighting_date = s["captured_at"][:10]
-                if prev_post_date < sighting_date <= post_date:
-                    linked_sightings.append(s)
-
-            # Sort by date
-            linked_sightings = sorted(linked_sightings, key=lambda s: s["captured_at"])
+            # Slice the date range (after prev_post_date, up to and including
+            # post_date); the slice is already ascending, no re-sort needed
+            lo = bisect.bisect_right(sighting_dates_asc, prev_post_date)
+            hi = bisect.bisect_right(sighting_dates_asc, post_date)
+            linked_sightings = sightings_asc[lo:hi]
 
-        html = template.render(
-            **base_context,
-            post=post,
-            linked_sightings=linked_sightings,
-        )
-        (output_path / "posts" / f"{post['slug']}.html").write_text(html)
+        post_jobs.append((
+            str(output_path / "posts" / f"{post['slug']}.html"),
+            {"post": post, "linked_sightings": linked_sightings},
+        ))
 
-    # Generate individual sighting pages
-    template = env.get_template("sighting.html")
+    # Build render jobs for individual sighting pages
 
     # Build observation timelines for all species
     species_timelines = build_species_timelines(sightings, observations)
     timeline_months = get_timeline_months()
 
+    sighting_jobs = []
     for idx, sighting in enumerate(sightings):
         # Prev/next navigation (sightings sorted newest first)
         prev_sighting = sightings[idx - 1] if idx > 0 else None
@@ -760,19 +868,28 @@ def build_site(output_path: Path):
         timeline = species_timelines.get(sci_name, [0] * 52)
         timeline_max = max(timeline) if timeline else 0
 
-        html = template.render(
-            **base_context,
-            sighting=sighting,
-            prev_sighting=prev_sighting,
-            next_sighting=next_sighting,
-            timeline=timeline,
-            timeline_months=timeline_months,
-            timeline_max=timeline_max,
-        )
-        (output_path / "sightings" / f"{sighting['id']}.html").write_text(html)
+        sighting_jobs.append((
+            str(output_path / "sightings" / f"{sighting['id']}.html"),
+            {
+                "sighting": sighting,
+                "prev_sighting": prev_sighting,
+                "next_sighting": next_sighting,
+                "timeline": timeline,
+                "timeline_months": timeline_months,
+                "timeline_max": timeline_max,
+            },
+        ))
+
+    # Render post and sighting pages (in parallel across cores when the
+    # site is big enough to make that worthwhile)
+    render_page_jobs(base_context, [
+        ("post.html", post_jobs),
+        ("sighting.html", sighting_jobs),
+    ])
 
     # Generate public sightings JSON for client-side filtering
-    public_sightings = [
+    # (single orjson dump to bytes - no intermediate text encode)
+    (output_path / "data" / "sightings.json").write_bytes(fastjson.dumps([
         {
             "id": s["id"],
             "common_name": s["common_name"],
@@ -783,17 +900,12 @@ def build_site(output_path: Path):
             "image": s["images"][0]["filename"] if s["images"] else "",
         }
         for s in sightings
-    ]
-    with open(output_path / "data" / "sightings.json", "w") as f:
-        json.dump(public_sightings, f)
+    ]))
 
     # Generate stats page
     stats = compute_stats(sightings, observations, config)
     template = env.get_template("stats.html")
-    html = template.render(
-        **base_context,
-        stats=stats,
-    )
+    html = template.render({**base_context, "stats": stats})
     (output_path / "stats.html").write_text(html)
 
     # Generate species tree page
@@ -803,17 +915,27 @@ def build_site(output_path: Path):
     tree_stats = get_species_stats(tree_data)
 
     template = env.get_template("tree.html")
-    html = template.render(
+    html = template.render({
         **base_context,
-        tree=tree_data["tree"],
-        unclassified=tree_data["unclassified"],
-        tree_stats=tree_stats,
-    )
+        "tree": tree_data["tree"],
+        "unclassified": tree_data["unclassified"],
+        "tree_stats": tree_stats,
+    })
     (output_path / "tree.html").write_text(html)
 
     # Generate RSS feed
     generate_rss(output_path, config, sightings, posts)
 
+    # Swap the staging directory into place; the old tree is renamed
+    # aside first and deleted off the critical path
+    old_path = final_output.parent / (final_output.name + ".old")
+    shutil.rmtree(old_path, ignore_errors=True)
+    if final_output.exists():
+        os.rename(final_output, old_path)
+        threading.Thread(target=shutil.rmtree, args=(old_path,), kwargs={"ignore_errors": True}, daemon=True).start()
+    os.rename(output_path, final_output)
+    output_path = final_output
+
     # Print summary
     print(f"\nBuilt site:")
     print(f"  - 1 index page")
@@ -868,72 +990,75 @@ def generate_rss(output_path: Path, config: dict, sightings: list, posts: list):
     items.sort(key=lambda x: x["sort_date"], reverse=True)
     items = items[:30]  # Keep top 30
 
-    # Build RSS XML
-    rss_items = ""
-    for item in items:
-        rss_items += f"""
-    <item>
-      <title>{escape_xml(item['title'])}</title>
-      <link>{item['link']}</link>
-      <description><![CDATA[{item['description']}]]></description>
-      <pubDate>{item['pub_date']}</pubDate>
-      <guid>{item['guid']}</guid>
-    </item>"""
-
-    rss = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
-  <channel>
-    <title>{escape_xml(config['site_title'])}</title>
-    <link>{site_url}</link>
-    <description>{escape_xml(config['site_description'])}</description>
-    <language>en</language>
-    <lastBuildDate>{format_rss_date(datetime.now().isoformat())}</lastBuildDate>
-    <atom:link href="{site_url}/feed.xml" rel="self" type="application/rss+xml"/>
-{rss_items}
-  </channel>
-</rss>
-"""
+    # Build RSS XML as an element tree - a single C-level serialization
+    # pass that escapes element text itself (descriptions are HTML and
+    # come out entity-escaped, which feed readers handle fine)
+    root = ET.Element("rss", {"version": "2.0", "xmlns:atom": "http://www.w3.org/2005/Atom"})
+    channel = ET.SubElement(root, "channel")
+    ET.SubElement(channel, "title").text = config["site_title"]
+    ET.SubElement(channel, "link").text = site_url
+    ET.SubElement(channel, "description").text = config["site_description"]
+    ET.SubElement(channel, "language").text = "en"
+    ET.SubElement(channel, "lastBuildDate").text = format_rss_date(datetime.now().isoformat())
+    ET.SubElement(channel, "atom:link", {
+        "href": f"{site_url}/feed.xml",
+        "rel": "self",
+        "type": "application/rss+xml",
+    })
 
-    (output_path / "feed.xml").write_text(rss)
+    for item in items:
+        item_el = ET.SubElement(channel, "item")
+        ET.SubElement(item_el, "title").text = item["title"]
+        ET.SubElement(item_el, "link").text = item["link"]
+        ET.SubElement(item_el, "description").text = item["description"]
+        ET.SubElement(item_el, "pubDate").text = item["pub_date"]
+        ET.SubElement(item_el, "guid").text = item["guid"]
+
+    (output_path / "feed.xml").write_bytes(
+        ET.tostring(root, encoding="utf-8", xml_declaration=True)
+    )
 
 
 def build_sighting_description(sighting: dict, image_url: str) -> str:
     """Build HTML description for sighting RSS item"""
+    # Hoist fields into locals - one dict probe each instead of several
+    common_name = escape_xml(sighting["common_name"])
+    scientific_name = sighting["scientific_name"]
+    notes = sighting["notes"]
+    weather = sighting.get("weather", {})
+    temp_max = weather.get("temp_max_c")
+
     desc = ""
     if image_url:
-        desc += f'<p><img src="{image_url}" alt="{escape_xml(sighting["common_name"])}" style="max-width:100%;"></p>'
+        desc += f'<p><img src="{image_url}" alt="{common_name}" style="max-width:100%;"></p>'
 
-    sci_name = f" (<em>{sighting['scientific_name']}</em>)" if sighting["scientific_name"] else ""
-    desc += f"<p><strong>{escape_xml(sighting['common_name'])}</strong>{sci_name}</p>"
+    sci_name = f" (<em>{scientific_name}</em>)" if scientific_name else ""
+    desc += f"<p><strong>{common_name}</strong>{sci_name}</p>"
     desc += f"<p>Category: {sighting['category'].title()} | Season: {sighting['season'].title()}</p>"
 
-    if sighting["notes"]:
-        desc += f"<p>{escape_xml(sighting['notes'])}</p>"
+    if notes:
+        desc += f"<p>{escape_xml(notes)}</p>"
 
-    weather = sighting.get("weather", {})
-    if weather.get("temp_max_c"):
-        desc += f"<p>Weather: {weather['temp_max_c']}°C, {weather['conditions']}</p>"
+    if temp_max:
+        desc += f"<p>Weather: {temp_max}°C, {weather['conditions']}</p>"
 
     return desc
 
 
 def build_post_description(post: dict, cover_url: str) -> str:
     """Build HTML description for post RSS item"""
-    desc = ""
-    if cover_url:
-        desc += f'<p><img src="{cover_url}" alt="{escape_xml(post["title"])}" style="max-width:100%;"></p>'
-
     # Include full post content
-    desc += post["content"]
-
-    return desc
+    if cover_url:
+        return f'<p><img src="{cover_url}" alt="{escape_xml(post["title"])}" style="max-width:100%;"></p>' + post["content"]
+    return post["content"]
 
 
 def format_rss_date(date_str: str) -> str:
     """Format date for RSS pubDate"""
     try:
         if "T" in date_str:
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            # fromisoformat accepts the Z suffix directly on 3.11+
+            dt = datetime.fromisoformat(date_str)
         else:
             dt = datetime.strptime(date_str, "%Y-%m-%d")
         return dt.strftime("%a, %d %b %Y %H:%M:%S +0000")
@@ -941,24 +1066,27 @@ def format_rss_date(date_str: str) -> str:
         return datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0000")
 
 
+# Translation table for escape_xml - one C-level pass over the input
+_XML_ESCAPES = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&apos;",
+})
+
+
 def escape_xml(text: str) -> str:
     """Escape special XML characters"""
-    return (
-        str(text)
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
+    return str(text).translate(_XML_ESCAPES)
 
 
 def serve(output_path: Path, port: int = 8000):
     """Serve the site locally"""
-    os.chdir(output_path)
-
     # Custom handler that skips DNS lookup (much faster)
     class QuietHandler(http.server.SimpleHTTPRequestHandler):
+        wbufsize = -1  # Fully buffered writes
+
         def address_string(self):
             # Skip reverse DNS lookup
             return self.client_address[0]
@@ -967,15 +1095,47 @@ def serve(output_path: Path, port: int = 8000):
             # Quieter logging
             pass
 
-    # Custom server that ignores broken pipe errors
-    class QuietServer(socketserver.TCPServer):
+        def copyfile(self, source, outputfile):
+            # Zero-copy file bytes kernel->socket where possible
+            try:
+                fd = source.fileno()
+                size = os.fstat(fd).st_size
+                outputfile.flush()
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(outputfile.fileno(), fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except (AttributeError, OSError, ValueError):
+                # Not a regular file (e.g. directory listing) - plain copy
+                super().copyfile(source, outputfile)
+
+    # Threaded server so parallel asset requests don't serialize;
+    # ignores broken pipe errors (browser cancelled request)
+    class QuietServer(http.server.ThreadingHTTPServer):
         allow_reuse_address = True
+        daemon_threads = True
+
+        def server_bind(self):
+            if hasattr(socket, "SO_REUSEPORT"):
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                except OSError:
+                    pass
+            super().server_bind()
 
         def handle_error(self, request, client_address):
-            # Silently ignore broken pipe errors (browser cancelled request)
             pass
 
-    with QuietServer(("", port), QuietHandler) as httpd:
+    # Hand the handler the directory by name rather than chdir-ing into
+    # it: the atomic rebuild swaps site/ out from under a long-running
+    # --serve, and a cwd pinned to the old inode would 404 everything.
+    # Each request re-resolves the path, so it always sees the new tree
+    handler = functools.partial(QuietHandler, directory=str(output_path))
+
+    with QuietServer(("", port), handler) as httpd:
         print(f"\nServing at http://localhost:{port}")
         print("Press Ctrl+C to stop\n")
         try:
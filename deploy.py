@@ -9,45 +9,116 @@ Usage:
 """
 
 import argparse
+import hashlib
+import mmap
+import os
+import shlex
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Not on Windows
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 PROJECT_ROOT = Path(__file__).parent
 SITE_PATH = PROJECT_ROOT / "site"
 PUBLIC_REPO = PROJECT_ROOT.parent / "asquaremeter-public"
 
+# Hoisted str forms - the sync loops below run per-file and shouldn't
+# re-stringify Path objects thousands of times
+_SITE_PATH_STR = str(SITE_PATH)
+_PUBLIC_REPO_STR = str(PUBLIC_REPO)
+
+# shutil's default 64KB copy buffer starves large assets (photos, video);
+# 1 MiB also sizes the per-call sendfile chunk on Linux
+shutil.COPY_BUFSIZE = 1 << 20
+
 
 def run_command(cmd: list, cwd: Path = None) -> bool:
-    """Run a shell command and return success status"""
+    """Run a shell command and return success status
+
+    stdout is inherited rather than piped - the command's own output
+    (git progress, etc.) streams straight to the terminal without pipe
+    buffering or a decode pass. Only stderr is captured, for the error
+    message on failure.
+    """
     try:
-        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+        result = subprocess.run(cmd, cwd=cwd, stderr=subprocess.PIPE)
         if result.returncode != 0:
-            print(f"Error: {result.stderr}")
+            # Decode lazily - the success path never touches the bytes
+            print(f"Error: {result.stderr.decode('utf-8', 'replace')}")
             return False
-        if result.stdout.strip():
-            print(result.stdout.strip())
         return True
     except Exception as e:
         print(f"Error running {' '.join(cmd)}: {e}")
         return False
 
 
+DEPLOY_CACHE_PATH = PROJECT_ROOT / ".deploy-cache"
+
+# Directories and suffixes that never feed into the built site
+_FINGERPRINT_SKIP_DIRS = {
+    ".git", "__pycache__", ".jinja_cache", "tests",
+    "site", "site.new", "site.old",
+}
+_FINGERPRINT_SKIP_SUFFIXES = (".pkl",)
+
+
+def _source_fingerprint() -> str:
+    """Hash (relpath, mtime_ns, size) for every build input.
+
+    Metadata only - no file contents are read, so this costs one stat
+    per file and finishes in milliseconds even for a large photo set.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    entries = []
+    root = str(PROJECT_ROOT)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _FINGERPRINT_SKIP_DIRS)
+        for fname in filenames:
+            if fname.endswith(_FINGERPRINT_SKIP_SUFFIXES) or fname == ".deploy-cache":
+                continue
+            path = os.path.join(dirpath, fname)
+            st = os.stat(path)
+            entries.append(f"{os.path.relpath(path, root)}\0{st.st_mtime_ns}\0{st.st_size}")
+    for entry in sorted(entries):
+        digest.update(entry.encode("utf-8"))
+    return digest.hexdigest()
+
+
 def build_site() -> bool:
-    """Run the build script"""
+    """Run the build script, skipping it when no source input changed"""
+    fingerprint = _source_fingerprint()
+    try:
+        # Only skip when the output is actually there - a matching
+        # fingerprint with no site/ (e.g. after rm -rf site) would
+        # otherwise dead-end every deploy until the cache is cleared
+        if DEPLOY_CACHE_PATH.read_text() == fingerprint and SITE_PATH.exists():
+            print("Sources unchanged; skipping build.")
+            return True
+    except OSError:
+        pass  # No cache yet - build
+
     print("Building site...")
-    result = subprocess.run(
-        [sys.executable, "build.py"],
-        cwd=PROJECT_ROOT,
-        capture_output=True,
-        text=True
-    )
-    print(result.stdout)
+    # Inherit stdio: build.py's progress streams to the terminal as it
+    # happens instead of being buffered whole and dumped at the end
+    result = subprocess.run([sys.executable, "build.py"], cwd=PROJECT_ROOT)
     if result.returncode != 0:
-        print(f"Build failed: {result.stderr}")
+        print(f"Build failed (exit {result.returncode})")
         return False
+    DEPLOY_CACHE_PATH.write_text(fingerprint)
     return True
 
 
@@ -60,53 +131,317 @@ def copy_to_public() -> bool:
 
     print(f"\nCopying to {PUBLIC_REPO}...")
 
-    # Remove old files (except .git and .gitignore)
-    for item in PUBLIC_REPO.iterdir():
-        if item.name in ('.git', '.gitignore'):
-            continue
-        if item.is_dir():
-            shutil.rmtree(item)
-        else:
-            item.unlink()
+    # Prefer rsync when available: one native process that mirrors the
+    # tree and only touches changed files, instead of O(N) Python
+    # delete+copy syscalls (trailing slashes = mirror contents)
+    global _last_sync_changes
+    if shutil.which("rsync"):
+        result = subprocess.run([
+            "rsync", "-a", "--delete-after", "--delay-updates",
+            "--exclude=.git", "--exclude=.gitignore",
+            _SITE_PATH_STR + "/", _PUBLIC_REPO_STR + "/",
+        ])
+        if result.returncode == 0:
+            # rsync's change set is unknown - clear any list left over
+            # from an earlier fallback run so staging rescans instead
+            # of replaying a stale diff
+            _last_sync_changes = None
+            print("Copied successfully.")
+            return True
+        print(f"rsync failed (exit {result.returncode}), falling back to copy")
+
+    copied, deleted = _sync_tree(SITE_PATH, PUBLIC_REPO)
+    _last_sync_changes = (copied, deleted)
+    print(f"Copied successfully ({len(copied)} copied, {len(deleted)} removed).")
+    return True
 
-    # Copy new files
-    for item in SITE_PATH.iterdir():
-        dest = PUBLIC_REPO / item.name
-        if item.is_dir():
-            shutil.copytree(item, dest)
+
+# Relative (copied, deleted) path lists from the last _sync_tree run;
+# None when rsync did the copy and the change set is unknown
+_last_sync_changes = None
+
+
+def _copy_file(job):
+    """Atomically replace dst with src's data, keeping mtime for the sync check.
+
+    Writing to a temp name and os.replace-ing means nothing ever observes
+    a half-copied file, and an interrupted deploy leaves the old version
+    intact. shutil.copyfile skips copy2's chmod/utime/xattr syscalls -
+    git doesn't care about metadata - but the destination mtime must
+    still mirror the source so the next _sync_tree pass recognizes the
+    file as unchanged.
+    """
+    src, dst, src_st = job
+    tmp = dst + ".deploy-tmp"
+    _clone_or_copy(src, tmp)
+    os.utime(tmp, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
+    os.replace(tmp, dst)
+
+
+_MMAP_HASH_MIN = 1 << 20
+
+
+def _file_digest(path: str, size: int) -> bytes:
+    """Hash a file's content; mmap-backed above 1 MiB.
+
+    Mapping a large asset lets blake2b read the page cache directly
+    instead of allocating a full userspace copy of the bytes first;
+    below a megabyte the plain read is cheaper than the map setup.
+    """
+    with open(path, "rb") as f:
+        if size >= _MMAP_HASH_MIN:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.blake2b(mm, digest_size=16).digest()
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+
+# Linux FICLONE ioctl: an O(1) copy-on-write clone on btrfs/xfs/zfs,
+# independent of file size
+_FICLONE = 0x40049409
+_reflink_supported = fcntl is not None and sys.platform == "linux"
+
+
+def _clone_or_copy(src: str, dst: str):
+    """Reflink src to dst when the filesystem supports it, else copy.
+
+    The first EOPNOTSUPP/EXDEV disables the attempt for the rest of the
+    run - every pair in a sync lives on the same filesystem pair, so one
+    failure means they all would fail.
+    """
+    global _reflink_supported
+    if _reflink_supported:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            _reflink_supported = False
+    shutil.copyfile(src, dst)
+
+
+def _sync_tree(src_root: Path, dst_root: Path) -> tuple[list, list]:
+    """Incrementally mirror src_root into dst_root (skipping .git/.gitignore).
+
+    Files whose size and mtime already match are left untouched, so IO -
+    and the git re-hashing downstream - scales with what actually
+    changed rather than with the whole site. Returns the relative paths
+    it touched as (copied, deleted) lists, which git_commit uses to
+    stage exactly those entries instead of rescanning the worktree.
+    """
+    # Work on plain strings throughout - per-file Path construction and
+    # implicit str() conversions add up over thousands of entries
+    src_root = str(src_root)
+    dst_root = str(dst_root)
+    preserved = {".git", ".gitignore"}
+    src_files = set()
+    src_dirs = set()
+
+    # Single-threaded pass: create directories and decide what to copy
+    to_copy = []
+    copied_rel = []
+    for dirpath, dirnames, filenames in os.walk(src_root):
+        rel_dir = os.path.relpath(dirpath, src_root)
+        dst_dir = dst_root if rel_dir == "." else os.path.join(dst_root, rel_dir)
+        if rel_dir != ".":
+            src_dirs.add(rel_dir)
+        os.makedirs(dst_dir, exist_ok=True)
+
+        for fname in filenames:
+            rel_path = fname if rel_dir == "." else os.path.join(rel_dir, fname)
+            src_files.add(rel_path)
+            src = os.path.join(dirpath, fname)
+            dst = os.path.join(dst_dir, fname)
+            src_st = os.stat(src)
+            try:
+                dst_st = os.stat(dst)
+                if dst_st.st_size == src_st.st_size:
+                    if dst_st.st_mtime == src_st.st_mtime:
+                        continue  # Unchanged
+                    # Same size, touched mtime (e.g. a rebuild that
+                    # rewrote identical bytes): compare content before
+                    # paying for a copy and a git re-hash
+                    if _file_digest(src, src_st.st_size) == _file_digest(dst, src_st.st_size):
+                        os.utime(dst, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
+                        continue
+            except OSError:
+                pass  # Destination missing - copy
+            to_copy.append((src, dst, src_st))
+            copied_rel.append(rel_path)
+
+    # Copy in parallel - small-file copies are syscall-latency bound and
+    # the GIL is released across those boundaries, so threads suffice
+    if to_copy:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            list(pool.map(_copy_file, to_copy, chunksize=16))
+
+    # Collect anything in the destination that no longer exists in the
+    # site; stale directories are pruned from the walk so only their
+    # top-level path is recorded
+    to_delete = []
+    deleted_rel = []
+    for dirpath, dirnames, filenames in os.walk(dst_root, topdown=True):
+        if dirpath == dst_root:
+            dirnames[:] = [d for d in dirnames if d not in preserved]
+        rel_dir = os.path.relpath(dirpath, dst_root)
+        for fname in filenames:
+            rel_path = fname if rel_dir == "." else os.path.join(rel_dir, fname)
+            if rel_dir == "." and fname in preserved:
+                continue
+            if rel_path not in src_files:
+                to_delete.append(os.path.join(dirpath, fname))
+                deleted_rel.append(rel_path)
+        for dname in list(dirnames):
+            rel_path = dname if rel_dir == "." else os.path.join(rel_dir, dname)
+            if rel_path not in src_dirs:
+                to_delete.append(os.path.join(dirpath, dname))
+                deleted_rel.append(rel_path)
+                dirnames.remove(dname)
+
+    # One rm -rf fork beats a Python-level unlink loop: coreutils' C
+    # unlinkat walk clears big stale trees in one process
+    if to_delete:
+        if shutil.which("rm"):
+            subprocess.run(["rm", "-rf", "--", *to_delete], check=True)
         else:
-            shutil.copy2(item, dest)
+            for path in to_delete:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.unlink(path)
 
-    print("Copied successfully.")
-    return True
+    return copied_rel, deleted_rel
+
+
+_repo = None
+
+
+def _open_repo():
+    """Open the public repo once and reuse it across deploy cycles.
+
+    In --watch mode the same Repository object (and its object/index
+    caches) serves every cycle, so repeated deploys don't pay git
+    startup at all.
+    """
+    global _repo
+    if _repo is None:
+        _repo = pygit2.Repository(str(PUBLIC_REPO))
+    return _repo
 
 
 def git_commit(message: str) -> bool:
     """Stage all changes and commit"""
     print(f"\nCommitting: {message}")
 
-    if not run_command(["git", "add", "-A"], cwd=PUBLIC_REPO):
-        return False
-
-    # Check if there are changes to commit
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
+    # In-process commit via libgit2 when pygit2 is installed - no
+    # fork/exec at all. Push stays a subprocess so the system ssh
+    # agent/credential helpers keep working.
+    if pygit2 is not None:
+        try:
+            repo = _open_repo()
+            if _last_sync_changes is not None:
+                # The sync already knows the exact change set - stage
+                # just those paths instead of rescanning the worktree,
+                # so staging scales with the diff, not the site
+                copied, deleted = _last_sync_changes
+                for rel_path in copied:
+                    repo.index.add(rel_path)
+                if deleted:
+                    repo.index.remove_all(deleted)
+            else:
+                repo.index.add_all()
+            repo.index.write()
+            tree = repo.index.write_tree()
+            parents = [] if repo.head_is_unborn else [repo.head.target]
+            if parents and repo[parents[0]].tree_id == tree:
+                print("No changes to commit.")
+                return True
+            signature = repo.default_signature
+            repo.create_commit("HEAD", signature, signature, message, tree, parents)
+            return True
+        except Exception as e:
+            print(f"pygit2 commit failed ({e}), falling back to git")
+
+    # One shell invocation, and no up-front status scan: commit runs
+    # immediately, and only when it fails do we ask the index whether
+    # the failure was just "nothing staged" (diff --cached --quiet
+    # exits 0 in that case, turning the no-op into success)
+    return run_command(
+        [
+            "bash", "-c",
+            f"git add -A && {{ git commit -m {shlex.quote(message)} "
+            "|| git diff --cached --quiet; }",
+        ],
         cwd=PUBLIC_REPO,
-        capture_output=True,
-        text=True
     )
 
-    if not result.stdout.strip():
-        print("No changes to commit.")
-        return True
-
-    return run_command(["git", "commit", "-m", message], cwd=PUBLIC_REPO)
-
 
 def git_push() -> bool:
     """Push to remote"""
     print("\nPushing to remote...")
-    return run_command(["git", "push"], cwd=PUBLIC_REPO)
+    # Inherit stdio: git's pack/progress output can run to megabytes on
+    # a slow link and we only need the exit code, so let it stream to
+    # the terminal instead of piping and decoding it
+    return subprocess.run(["git", "push"], cwd=PUBLIC_REPO).returncode == 0
+
+
+def _warm_remote():
+    """Touch origin so the transport and credentials are cached.
+
+    git ls-remote performs the SSH/HTTPS handshake and credential-helper
+    dance; running it in the background during the build means git_push
+    finds everything warm instead of paying the network RTT serially.
+    """
+    subprocess.run(
+        ["git", "ls-remote", "--exit-code", "origin", "HEAD"],
+        cwd=PUBLIC_REPO,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def deploy_once(commit_msg: str = None, push: bool = False) -> bool:
+    """Run one build -> copy -> commit -> push cycle"""
+    # Overlap the remote handshake with the build when we know a push
+    # is coming
+    warm = None
+    if push and PUBLIC_REPO.exists():
+        warm = threading.Thread(target=_warm_remote, daemon=True)
+        warm.start()
+
+    if not build_site():
+        return False
+
+    if not copy_to_public():
+        return False
+
+    if commit_msg:
+        if not git_commit(commit_msg):
+            return False
+
+    if push:
+        if warm is not None:
+            warm.join()  # Avoid two credential prompts racing
+        if not git_push():
+            return False
+
+    return True
+
+
+def watch(commit_msg: str = None, push: bool = False, interval: float = 2.0):
+    """Redeploy in a loop, amortizing startup across cycles.
+
+    Everything stays warm between cycles: the interpreter, imported
+    modules, and (via pygit2) the open repository - no per-deploy
+    fork/exec of python or git for the commit step.
+    """
+    print(f"Watching for changes (every {interval:g}s, Ctrl+C to stop)...")
+    try:
+        while True:
+            if not deploy_once(commit_msg, push):
+                print("Deploy failed; retrying on next cycle.")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped.")
 
 
 def main():
@@ -114,9 +449,19 @@ def main():
     parser.add_argument("--commit", "-c", metavar="MSG", help="Commit with message")
     parser.add_argument("--push", "-p", action="store_true", help="Push after commit")
     parser.add_argument("--message", "-m", metavar="MSG", help="Commit message (alternative to --commit)")
+    parser.add_argument("--watch", "-w", action="store_true", help="Keep redeploying in a loop")
 
     args = parser.parse_args()
 
+    # Reuse one SSH connection across every git subprocess this run
+    # (ls-remote warm-up, push, watch-mode cycles): the first handshake
+    # opens a control socket that later invocations piggyback on.
+    # setdefault keeps any GIT_SSH_COMMAND the user already exported.
+    os.environ.setdefault(
+        "GIT_SSH_COMMAND",
+        "ssh -o ControlMaster=auto -o ControlPath=~/.ssh/cm-%r@%h:%p -o ControlPersist=60s",
+    )
+
     # Determine commit message
     commit_msg = args.commit or args.message
 
@@ -124,24 +469,13 @@ def main():
     if args.push and not commit_msg:
         commit_msg = f"Update site - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
 
-    # Build
-    if not build_site():
-        sys.exit(1)
+    if args.watch:
+        watch(commit_msg, args.push)
+        return
 
-    # Copy to public repo
-    if not copy_to_public():
+    if not deploy_once(commit_msg, args.push):
         sys.exit(1)
 
-    # Commit if message provided
-    if commit_msg:
-        if not git_commit(commit_msg):
-            sys.exit(1)
-
-    # Push if requested
-    if args.push:
-        if not git_push():
-            sys.exit(1)
-
     print("\nDone!")
 
 
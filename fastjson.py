@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+fastjson.py - Thin JSON shim that uses orjson when available
+
+orjson parses and serializes several times faster than the stdlib json
+module on the large sightings/observations blobs. It is optional: if it
+isn't installed we fall back to stdlib json with matching semantics
+(UTF-8 bytes in, UTF-8 bytes out, ensure_ascii=False).
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by 2"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
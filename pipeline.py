@@ -14,20 +14,39 @@ Commands:
 """
 
 import argparse
-import json
+import heapq
+import math
 import os
+import re
 import sys
-from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import ephem
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dateutil import parser as date_parser
 from dateutil import tz
 from PIL import Image
 from PIL.ExifTags import TAGS
 
+import fastjson
+
+try:
+    import piexif
+except ImportError:
+    piexif = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent
 CONFIG_PATH = PROJECT_ROOT / "config.json"
@@ -36,6 +55,57 @@ OBSERVATIONS_PATH = PROJECT_ROOT / "data" / "observations.json"
 INBOX_PATH = PROJECT_ROOT / "inbox"
 CATALOG_PATH = PROJECT_ROOT / "catalog"
 
+TIMES_OF_DAY = ("morning", "afternoon", "evening", "night")
+TOD_STR = "/".join(TIMES_OF_DAY)
+
+# Comma-separated input fields: one C-level split that also eats the
+# surrounding whitespace, instead of strip() per element
+_COMMA_SPLIT = re.compile(r"\s*,\s*")
+
+# Accepted certainty inputs (letter or full word) -> stored value
+_CERTAINTY_MAP = {
+    "h": "high", "high": "high",
+    "m": "medium", "medium": "medium",
+    "l": "low", "low": "low",
+}
+
+# Shared keep-alive session for Open-Meteo: reuses the TCP+TLS
+# connection across calls. With requests-cache installed it also
+# persists responses on disk - historic days never change (cache
+# forever), forecast-window days expire after an hour.
+if requests_cache is not None:
+    SESSION = requests_cache.CachedSession(
+        str(PROJECT_ROOT / ".openmeteo_cache"),
+        expire_after=-1,
+        urls_expire_after={"api.open-meteo.com": 3600},
+    )
+else:
+    SESSION = requests.Session()
+
+# One pooled connection per Open-Meteo host and a couple of quick
+# retries for transient blips; gzip is already requested by default
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+
+DAILY_PARAMS = [
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "precipitation_sum",
+    "weather_code",
+    "relative_humidity_2m_mean",
+    "pressure_msl_mean",
+    "wind_speed_10m_max",
+    "wind_direction_10m_dominant",
+    "soil_temperature_0_to_7cm_mean",
+    "uv_index_max",
+]
+
 # Weather code mapping (WMO codes)
 WEATHER_CODES = {
     0: "Clear sky",
@@ -59,52 +129,132 @@ WEATHER_CODES = {
 }
 
 
+@lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load configuration from config.json"""
-    with open(CONFIG_PATH) as f:
-        return json.load(f)
+    """Load configuration from config.json.
+
+    Cached for the process lifetime - config never changes mid-run and
+    several commands read it more than once. Call
+    load_config.cache_clear() if that ever stops being true.
+    """
+    return fastjson.loads(CONFIG_PATH.read_bytes())
 
 
 def load_sightings() -> list:
     """Load all sightings from sightings.json"""
     if not SIGHTINGS_PATH.exists():
         return []
-    with open(SIGHTINGS_PATH) as f:
-        return json.load(f)
+    return fastjson.loads(SIGHTINGS_PATH.read_bytes())
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write a sibling temp file and rename it over the target.
+
+    os.replace is atomic on POSIX and Windows, so a crash mid-save
+    leaves the old file intact instead of a truncated one.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
 
 
 def save_sightings(sightings: list) -> None:
     """Save sightings to sightings.json"""
-    with open(SIGHTINGS_PATH, "w") as f:
-        json.dump(sightings, f, indent=2, ensure_ascii=False)
+    _atomic_write(SIGHTINGS_PATH, fastjson.dumps(sightings, indent=True))
+
+
+def _append_record(path: Path, record: dict) -> None:
+    """Append one record to an on-disk JSON array in O(record) time.
+
+    Instead of re-serializing the whole list per insert, splice the new
+    entry in before the closing bracket: truncate the trailing "]" and
+    write ",\\n  <record>\\n]". Small files (including the empty-array
+    case) just take the full rewrite, which costs the same.
+    """
+    size = path.stat().st_size
+    if size < 4096:
+        records = fastjson.loads(path.read_bytes())
+        records.append(record)
+        _atomic_write(path, fastjson.dumps(records, indent=True))
+        return
+
+    entry = fastjson.dumps(record, indent=True).decode("utf-8").replace("\n", "\n  ")
+    with open(path, "r+b") as f:
+        f.seek(size - 64)
+        tail = f.read()
+        bracket = tail.rfind(b"]")
+        if bracket == -1:
+            raise ValueError(f"{path} does not end with a JSON array")
+        # Back up over any whitespace preceding the bracket
+        j = bracket - 1
+        while j >= 0 and tail[j : j + 1].isspace():
+            j -= 1
+        offset = size - len(tail) + j + 1
+        data = f",\n  {entry}\n]".encode("utf-8")
+        # Write first, truncate second: the new tail is longer than the
+        # "\n]" remnant it overwrites, so a crash between the two calls
+        # leaves a parseable array instead of a file with no closing
+        # bracket
+        os.pwrite(f.fileno(), data, offset)
+        f.truncate(offset + len(data))
+
+
+def append_sighting(sighting: dict) -> None:
+    """Append a single sighting without rewriting the whole file"""
+    if not SIGHTINGS_PATH.exists():
+        save_sightings([sighting])
+    else:
+        _append_record(SIGHTINGS_PATH, sighting)
+
+
+def append_observation(observation: dict) -> None:
+    """Append a single observation without rewriting the whole file"""
+    if not OBSERVATIONS_PATH.exists():
+        save_observations([observation])
+    else:
+        _append_record(OBSERVATIONS_PATH, observation)
 
 
 def load_observations() -> list:
     """Load all quick observations from observations.json"""
     if not OBSERVATIONS_PATH.exists():
         return []
-    with open(OBSERVATIONS_PATH) as f:
-        return json.load(f)
+    return fastjson.loads(OBSERVATIONS_PATH.read_bytes())
 
 
 def save_observations(observations: list) -> None:
     """Save observations to observations.json"""
-    with open(OBSERVATIONS_PATH, "w") as f:
-        json.dump(observations, f, indent=2, ensure_ascii=False)
+    _atomic_write(OBSERVATIONS_PATH, fastjson.dumps(observations, indent=True))
 
 
+@lru_cache(maxsize=1024)
 def to_title_case(text: str) -> str:
-    """Convert text to Title Case for consistent naming"""
+    """Convert text to Title Case for consistent naming.
+
+    Cached: normalize_name calls this for every tag and species name,
+    and batch runs repeat the same handful of strings. Not str.title(),
+    which would also capitalize after hyphens ("Red-Tailed Hawk").
+    """
     return " ".join(word.capitalize() for word in text.split())
 
 
-def normalize_name(name: str, existing_names: set) -> str:
-    """Normalize a species name, matching existing if similar"""
+def normalize_name(name: str, existing_names) -> str:
+    """Normalize a species name, matching existing if similar.
+
+    existing_names is either a set of canonical names (linear scan) or
+    a pre-built {lowercase: canonical} dict for O(1) matching - the
+    commands build the dict once per run.
+    """
     title_name = to_title_case(name.strip())
+    # casefold, not lower: Unicode-correct matching for names
+    lowered = title_name.casefold()
+
+    if isinstance(existing_names, dict):
+        return existing_names.get(lowered, title_name)
 
     # Check for exact match (case-insensitive)
     for existing in existing_names:
-        if existing.lower() == title_name.lower():
+        if existing.casefold() == lowered:
             return existing
 
     return title_name
@@ -129,10 +279,9 @@ def validate_scientific_name(name: str) -> tuple[bool, str, str]:
     if len(words) < 2:
         return False, name, "Scientific name needs at least two parts (e.g., 'Genus species' or 'Genus sp.')"
 
-    # Normalize: First word capitalized, rest lowercase
-    normalized = words[0].capitalize()
-    for word in words[1:]:
-        normalized += " " + word.lower()
+    # Normalize: First word capitalized, rest lowercase (single join,
+    # no quadratic string concatenation)
+    normalized = " ".join([words[0].capitalize(), *(w.lower() for w in words[1:])])
 
     # Check for "sp" without period
     if normalized.endswith(" sp"):
@@ -195,9 +344,62 @@ def prompt_with_validation(prompt_text: str, validator_fn, *validator_args, allo
             print(f"  ✗ {error}")
 
 
+# Date (and optional time) embedded in a filename, e.g.
+# IMG_20240515_143210.jpg or 2024-05-15-ants.jpg
+_FILENAME_DATE = re.compile(
+    r"(20\d{2})[-_]?(\d{2})[-_]?(\d{2})(?:[-_ ](\d{2})[-_.]?(\d{2})[-_.]?(\d{2}))?"
+)
+
+
+def _date_from_filename(image_path: Path) -> tuple[Optional[datetime], bool]:
+    """Read the capture date from a dated filename, if it has one.
+
+    Cameras and phones commonly embed the timestamp in the name; when
+    both date and time are present the EXIF parse can be skipped
+    entirely. Returns (datetime, has_time); (None, False) when the name
+    has no plausible date. A date without a time is only a fallback -
+    midnight is not the capture time.
+    """
+    match = _FILENAME_DATE.search(image_path.stem)
+    if not match:
+        return None, False
+    try:
+        if match.group(4):
+            return datetime(*(int(g) for g in match.groups())), True
+        return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3))), False
+    except ValueError:
+        return None, False
+
+
+# EXIF DateTimeOriginal tag id
+_EXIF_DATETIME_ORIGINAL = 36867
+
+
 def get_exif_date(image_path: Path) -> Optional[datetime]:
-    """Extract DateTimeOriginal from image EXIF data"""
+    """Extract DateTimeOriginal from image EXIF data.
+
+    JPEGs keep EXIF in an APP1 segment at the start of the file, so a
+    64 KiB head read is enough - no need to hand the whole multi-MB
+    file to PIL. Non-JPEG inbox formats (PNG) don't carry EXIF dates
+    in practice and are skipped outright.
+    """
     try:
+        with open(image_path, "rb") as f:
+            head = f.read(65536)
+
+        if not head.startswith(b"\xff\xd8"):
+            return None  # Not a JPEG - no EXIF date to find
+
+        if piexif is not None:
+            try:
+                exif_dict = piexif.load(head)
+                value = exif_dict.get("Exif", {}).get(_EXIF_DATETIME_ORIGINAL)
+                if value:
+                    return datetime.strptime(value.decode("ascii"), "%Y:%m:%d %H:%M:%S")
+                return None
+            except Exception:
+                pass  # Truncated segment or odd EXIF - let PIL try
+
         img = Image.open(image_path)
         exif_data = img._getexif()
         if exif_data:
@@ -237,6 +439,15 @@ def get_time_of_day(dt: datetime) -> str:
         return "night"
 
 
+def _first(daily: dict, key: str):
+    """First daily value for key, or None if missing/empty.
+
+    Avoids allocating a throwaway [None] default list per field access.
+    """
+    values = daily.get(key)
+    return values[0] if values else None
+
+
 def fetch_weather(lat: float, lon: float, date: datetime, timezone: str) -> dict:
     """Fetch weather data from Open-Meteo API"""
     date_str = date.strftime("%Y-%m-%d")
@@ -245,51 +456,38 @@ def fetch_weather(lat: float, lon: float, date: datetime, timezone: str) -> dict
 
     # Choose API based on date
     if (today - target_date).days <= 7:
-        base_url = "https://api.open-meteo.com/v1/forecast"
+        base_url = FORECAST_URL
     else:
-        base_url = "https://archive-api.open-meteo.com/v1/archive"
-
-    daily_params = [
-        "temperature_2m_max",
-        "temperature_2m_min",
-        "precipitation_sum",
-        "weather_code",
-        "relative_humidity_2m_mean",
-        "pressure_msl_mean",
-        "wind_speed_10m_max",
-        "wind_direction_10m_dominant",
-        "soil_temperature_0_to_7cm_mean",
-        "uv_index_max",
-    ]
+        base_url = ARCHIVE_URL
 
     params = {
         "latitude": lat,
         "longitude": lon,
         "start_date": date_str,
         "end_date": date_str,
-        "daily": ",".join(daily_params),
+        "daily": ",".join(DAILY_PARAMS),
         "timezone": timezone,
     }
 
     try:
-        response = requests.get(base_url, params=params, timeout=10)
+        response = SESSION.get(base_url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
         daily = data.get("daily", {})
-        weather_code = daily.get("weather_code", [0])[0] or 0
+        weather_code = _first(daily, "weather_code") or 0
 
         return {
-            "temp_max_c": daily.get("temperature_2m_max", [None])[0],
-            "temp_min_c": daily.get("temperature_2m_min", [None])[0],
-            "precipitation_mm": daily.get("precipitation_sum", [0])[0] or 0,
+            "temp_max_c": _first(daily, "temperature_2m_max"),
+            "temp_min_c": _first(daily, "temperature_2m_min"),
+            "precipitation_mm": _first(daily, "precipitation_sum") or 0,
             "conditions": WEATHER_CODES.get(weather_code, "Unknown"),
-            "humidity_percent": daily.get("relative_humidity_2m_mean", [None])[0],
-            "pressure_hpa": daily.get("pressure_msl_mean", [None])[0],
-            "wind_speed_kmh": daily.get("wind_speed_10m_max", [None])[0],
-            "wind_direction_deg": daily.get("wind_direction_10m_dominant", [None])[0],
-            "soil_temp_c": daily.get("soil_temperature_0_to_7cm_mean", [None])[0],
-            "uv_index": daily.get("uv_index_max", [None])[0],
+            "humidity_percent": _first(daily, "relative_humidity_2m_mean"),
+            "pressure_hpa": _first(daily, "pressure_msl_mean"),
+            "wind_speed_kmh": _first(daily, "wind_speed_10m_max"),
+            "wind_direction_deg": _first(daily, "wind_direction_10m_dominant"),
+            "soil_temp_c": _first(daily, "soil_temperature_0_to_7cm_mean"),
+            "uv_index": _first(daily, "uv_index_max"),
         }
     except Exception as e:
         print(f"Warning: Could not fetch weather data: {e}")
@@ -307,36 +505,106 @@ def fetch_weather(lat: float, lon: float, date: datetime, timezone: str) -> dict
         }
 
 
-def get_moon_phase(date: datetime) -> dict:
-    """Calculate moon phase for a given date"""
-    observer = ephem.Observer()
-    date_str = date.strftime("%Y/%m/%d")
-    observer.date = date_str
+def fetch_weather_range(lat: float, lon: float, start_date: str, end_date: str,
+                        timezone: str, base_url: str) -> dict:
+    """Fetch daily weather for an inclusive date range in one request.
+
+    Open-Meteo returns daily arrays indexed by day, so a whole range
+    costs the same round-trip as a single date. Returns a dict mapping
+    date string (YYYY-MM-DD) to a weather dict shaped like
+    fetch_weather's.
+    """
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "start_date": start_date,
+        "end_date": end_date,
+        "daily": ",".join(DAILY_PARAMS),
+        "timezone": timezone,
+    }
+
+    response = SESSION.get(base_url, params=params, timeout=30)
+    response.raise_for_status()
+    daily = response.json().get("daily", {})
+
+    def column(key, i):
+        values = daily.get(key)
+        return values[i] if values and i < len(values) else None
+
+    weather_by_date = {}
+    for i, date_str in enumerate(daily.get("time", [])):
+        weather_code = column("weather_code", i) or 0
+        weather_by_date[date_str] = {
+            "temp_max_c": column("temperature_2m_max", i),
+            "temp_min_c": column("temperature_2m_min", i),
+            "precipitation_mm": column("precipitation_sum", i) or 0,
+            "conditions": WEATHER_CODES.get(weather_code, "Unknown"),
+            "humidity_percent": column("relative_humidity_2m_mean", i),
+            "pressure_hpa": column("pressure_msl_mean", i),
+            "wind_speed_kmh": column("wind_speed_10m_max", i),
+            "wind_direction_deg": column("wind_direction_10m_dominant", i),
+            "soil_temp_c": column("soil_temperature_0_to_7cm_mean", i),
+            "uv_index": column("uv_index_max", i),
+        }
+
+    return weather_by_date
+
+
+def prefetch_weather(lat: float, lon: float, dates: set, timezone: str) -> dict:
+    """Fetch weather for a set of dates in at most two range requests.
+
+    Dates inside the forecast window (last 7 days) and older archive
+    dates live on different hosts, so each side gets one range call.
+    Failures return what was fetched so far; missing dates fall back to
+    per-day fetch_weather at use time.
+    """
+    today = datetime.now().date()
+    recent = {d for d in dates
+              if (today - datetime.strptime(d, "%Y-%m-%d").date()).days <= 7}
+    older = dates - recent
 
-    moon = ephem.Moon(observer)
-    illumination = moon.phase / 100.0  # 0 to 1
+    out = {}
+    try:
+        if older:
+            out.update(fetch_weather_range(lat, lon, min(older), max(older), timezone, ARCHIVE_URL))
+        if recent:
+            out.update(fetch_weather_range(lat, lon, min(recent), max(recent), timezone, FORECAST_URL))
+    except Exception as e:
+        print(f"Warning: batch weather fetch failed: {e}")
+    return out
 
-    # Determine if waxing or waning by comparing to next/previous full moon
-    next_full = ephem.next_full_moon(date_str)
-    prev_full = ephem.previous_full_moon(date_str)
-    next_new = ephem.next_new_moon(date_str)
-    prev_new = ephem.previous_new_moon(date_str)
 
-    # Calculate days to/from key phases
-    days_since_new = float(ephem.Date(date_str) - prev_new)
-    days_to_full = float(next_full - ephem.Date(date_str))
-    days_since_full = float(ephem.Date(date_str) - prev_full)
-    days_to_new = float(next_new - ephem.Date(date_str))
+# Mean synodic month in days and a reference new moon (2000-01-06),
+# per Meeus
+_SYNODIC_MONTH = 29.530588853
+_NEW_MOON_JD = 2451550.1
 
-    # Determine phase based on position in lunar cycle
-    if days_to_full < 1.0 or days_since_full < 1.0:
+
+def get_moon_phase(date: datetime) -> dict:
+    """Calculate moon phase for a given date (memoized per day)"""
+    return dict(_moon_phase_cached(date.toordinal()))
+
+
+@lru_cache(maxsize=4096)
+def _moon_phase_cached(ordinal: int) -> dict:
+    # Closed-form mean-phase calculation: the moon's age is the time
+    # since a reference new moon modulo the synodic month, and
+    # illumination follows from the phase angle. Accurate to a fraction
+    # of a day, which the one-day phase bins absorb - no iterative
+    # root-finding over four separate ephemeris searches.
+    jd_noon = ordinal + 1721425.0
+    age = (jd_noon - _NEW_MOON_JD) % _SYNODIC_MONTH
+    illumination = (1 - math.cos(2 * math.pi * age / _SYNODIC_MONTH)) / 2
+
+    half_cycle = _SYNODIC_MONTH / 2
+    if abs(age - half_cycle) < 1.0:
         # Within 1 day of full moon
         phase_name = "Full Moon"
-    elif days_to_new < 1.0 or days_since_new < 1.0:
+    elif age < 1.0 or age > _SYNODIC_MONTH - 1.0:
         # Within 1 day of new moon
         phase_name = "New Moon"
-    elif days_since_new < days_since_full:
-        # We're in the first half (waxing) - between new and full
+    elif age < half_cycle:
+        # First half (waxing) - between new and full
         if illumination < 0.50:
             phase_name = "Waxing Crescent"
         elif illumination < 0.55:
@@ -344,7 +612,7 @@ def get_moon_phase(date: datetime) -> dict:
         else:
             phase_name = "Waxing Gibbous"
     else:
-        # We're in the second half (waning) - between full and new
+        # Second half (waning) - between full and new
         if illumination > 0.55:
             phase_name = "Waning Gibbous"
         elif illumination > 0.45:
@@ -359,11 +627,16 @@ def get_moon_phase(date: datetime) -> dict:
 
 
 def get_sun_times(lat: float, lon: float, date: datetime, timezone_str: str) -> dict:
-    """Calculate sunrise and sunset times"""
+    """Calculate sunrise and sunset times (memoized per location and day)"""
+    return dict(_sun_times_cached(lat, lon, date.strftime("%Y/%m/%d"), timezone_str))
+
+
+@lru_cache(maxsize=512)
+def _sun_times_cached(lat: float, lon: float, date_str: str, timezone_str: str) -> dict:
     observer = ephem.Observer()
     observer.lat = str(lat)
     observer.lon = str(lon)
-    observer.date = date.strftime("%Y/%m/%d")
+    observer.date = date_str
 
     sun = ephem.Sun()
 
@@ -384,17 +657,31 @@ def get_sun_times(lat: float, lon: float, date: datetime, timezone_str: str) ->
         return {"sunrise": "Unknown", "sunset": "Unknown"}
 
 
+_MONTH_NUMBERS = {
+    name: i for i, name in enumerate(
+        ["january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"], 1)
+}
+
+
+@lru_cache(maxsize=8)
+def _season_by_month(frozen_definitions: tuple) -> tuple:
+    """Build a 13-slot month -> season lookup from frozen config items"""
+    lut = ["unknown"] * 13
+    for season, months in frozen_definitions:
+        for month_name in months:
+            index = _MONTH_NUMBERS.get(month_name)
+            if index:
+                lut[index] = season
+    return tuple(lut)
+
+
 def get_season(month: int, season_definitions: dict) -> str:
     """Determine season from month"""
-    month_names = [
-        "", "january", "february", "march", "april", "may", "june",
-        "july", "august", "september", "october", "november", "december"
-    ]
-    month_name = month_names[month]
-    for season, months in season_definitions.items():
-        if month_name in months:
-            return season
-    return "unknown"
+    # The scan over season_definitions runs once per distinct config;
+    # after that this is a single indexed lookup per sighting
+    frozen = tuple((season, tuple(months)) for season, months in season_definitions.items())
+    return _season_by_month(frozen)[month]
 
 
 def generate_id(date: datetime, sightings: list) -> str:
@@ -402,15 +689,83 @@ def generate_id(date: datetime, sightings: list) -> str:
     date_prefix = date.strftime("%Y%m%d")
 
     # Count existing sightings for this date
-    existing = [s for s in sightings if s["id"].startswith(date_prefix)]
-    sequence = len(existing) + 1
+    sequence = sum(1 for s in sightings if s["id"][:8] == date_prefix) + 1
+
+    return f"{date_prefix}-{sequence:03d}"
+
+
+def next_sequence_id(date: datetime, date_counts: Counter) -> str:
+    """Counter-backed generate_id for bulk runs.
 
+    cmd_add seeds date_counts once from the loaded sightings; each new
+    id is then a dict bump instead of another full-list scan, which
+    kept generate_id quadratic across a long inbox session.
+    """
+    date_prefix = date.strftime("%Y%m%d")
+    sequence = date_counts[date_prefix] + 1
+    date_counts[date_prefix] = sequence
     return f"{date_prefix}-{sequence:03d}"
 
 
+@lru_cache(maxsize=1)
+def _r2():
+    """Import r2_upload once, lazily.
+
+    Pulling boto3 in costs hundreds of milliseconds, so the import only
+    happens for commands that actually touch R2, and only once per
+    process. Returns the module, or None when it isn't installed.
+    """
+    try:
+        import r2_upload
+        return r2_upload
+    except ImportError:
+        return None
+
+
+def _seq_to_letter(n: int) -> str:
+    """Image suffix for a zero-based sequence: a..z, then aa, ab, ...
+
+    Bijective base-26, so the scheme keeps working past the 26th image
+    instead of walking off the end of the alphabet.
+    """
+    s = ""
+    n += 1
+    while n:
+        n, r = divmod(n - 1, 26)
+        s = chr(97 + r) + s
+    return s
+
+
+def _sighting_date(s: dict) -> str:
+    """YYYY-MM-DD for a sighting.
+
+    New records carry a denormalized date field; older ones predate it
+    and fall back to slicing captured_at.
+    """
+    return s.get("date") or s["captured_at"][:10]
+
+
+def _index_sightings(sightings: list) -> dict:
+    """Map sighting id -> list index for O(1) lookup by id.
+
+    The list stays the source of truth; the index is rebuilt per
+    command run, which beats the linear scan the moment the catalog
+    holds more than a handful of records.
+    """
+    return {s["id"]: idx for idx, s in enumerate(sightings)}
+
+
+def _downscale(img: Image.Image, max_width: int) -> Image.Image:
+    """Resize to fit max_width (never upscales), preserving aspect ratio"""
+    if img.width <= max_width:
+        return img
+    height = round(img.height * max_width / img.width)
+    return img.resize((max_width, height), Image.LANCZOS)
+
+
 def process_image(input_path: Path, output_id: str, letter: str) -> str:
     """Process image into three sizes, upload to R2, return filename"""
-    from r2_upload import is_r2_configured, upload_to_r2
+    r2 = _r2()
 
     img = Image.open(input_path)
 
@@ -418,29 +773,50 @@ def process_image(input_path: Path, output_id: str, letter: str) -> str:
     if img.mode in ("RGBA", "P"):
         img = img.convert("RGB")
 
+    # Force the decode now: the parallel saves below may share this
+    # object (small originals skip the downscale) and PIL's lazy file
+    # handle is not thread-safe
+    img.load()
+
     filename = f"{output_id}-{letter}.jpg"
 
-    # Thumbnail (300px wide, higher quality)
-    thumb = img.copy()
-    thumb.thumbnail((300, 10000), Image.LANCZOS)
-    thumb_path = CATALOG_PATH / "thumb" / filename
-    thumb.save(thumb_path, "JPEG", quality=90)
+    # Derive sizes as a pyramid: the 300px thumb downscales the 1200px
+    # web image rather than the full-res original, and neither step
+    # needs the full-frame pixel copy that img.copy()+thumbnail() made
+    web = _downscale(img, 1200)
+    thumb = _downscale(web, 300)
+
+    # Small originals come back aliased (_downscale never upscales).
+    # save() stores encoder state on the Image instance, so the three
+    # parallel saves below each need their own object or the quality
+    # settings bleed between sizes
+    if web is img:
+        web = img.copy()
+    if thumb is web:
+        thumb = web.copy()
 
-    # Web (1200px wide, high quality)
-    web = img.copy()
-    web.thumbnail((1200, 10000), Image.LANCZOS)
+    thumb_path = CATALOG_PATH / "thumb" / filename
     web_path = CATALOG_PATH / "web" / filename
-    web.save(web_path, "JPEG", quality=92)
-
-    # Full (original size as JPG)
     full_path = CATALOG_PATH / "full" / filename
-    img.save(full_path, "JPEG", quality=95)
 
-    # Upload to R2 if configured
-    if is_r2_configured():
-        upload_to_r2(thumb_path, f"thumb/{filename}")
-        upload_to_r2(web_path, f"web/{filename}")
-        upload_to_r2(full_path, f"full/{filename}")
+    # Encode and upload each size on its own worker - libjpeg releases
+    # the GIL and each upload starts as soon as its encode finishes, so
+    # wall time is the slowest size rather than slowest encode plus
+    # slowest upload
+    r2_enabled = r2 is not None and r2.is_r2_configured()
+
+    def encode_and_upload(image, path, quality, key):
+        image.save(path, "JPEG", quality=quality)
+        if r2_enabled:
+            r2.upload_to_r2(path, key)
+
+    jobs = [
+        (thumb, thumb_path, 90, f"thumb/{filename}"),
+        (web, web_path, 92, f"web/{filename}"),
+        (img, full_path, 95, f"full/{filename}"),
+    ]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda job: encode_and_upload(*job), jobs))
 
     return filename
 
@@ -466,27 +842,65 @@ def cmd_add(args):
     print(f"Found {len(image_files)} image(s) to process\n")
     added_count = 0
 
+    # Timestamped filenames (IMG_20240515_143210 etc.) skip the EXIF
+    # read; the remaining files get their headers parsed, in parallel
+    # before the interactive loop since the reads are I/O-bound. A
+    # date-only name (2024-05-15-ants.jpg) is just a fallback when the
+    # headers have nothing - midnight is not the capture time
+    name_dates = {f: _date_from_filename(f) for f in image_files}
+    exif_dates = {f: dt for f, (dt, has_time) in name_dates.items() if has_time}
+    need_exif = [f for f in image_files if f not in exif_dates]
+    if need_exif:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            exif_dates.update(zip(need_exif, pool.map(get_exif_date, need_exif)))
+    for f in need_exif:
+        if exif_dates[f] is None:
+            exif_dates[f] = name_dates[f][0]
+
+    # Per-date id counters, seeded once from the existing data
+    date_counts = Counter(s["id"][:8] for s in sightings)
+
+    # Lowercase -> canonical lookups for name/tag normalization, built
+    # once per run and updated in place as sightings are added -
+    # rebuilding them per image made the loop O(images x sightings)
+    observations = load_observations()
+    existing_species = {s["common_name"].casefold(): s["common_name"] for s in sightings}
+    existing_species.update({o["common_name"].casefold(): o["common_name"] for o in observations})
+    existing_tags = {tag.casefold(): tag for s in sightings for tag in s.get("tags", [])}
+
+    # One batched range request per API host covers every image that
+    # has an EXIF date; images needing a prompted date fall back to the
+    # per-day fetch inside the loop
+    weather_by_date = {}
+    known_dates = {dt.strftime("%Y-%m-%d") for dt in exif_dates.values() if dt}
+    if known_dates:
+        weather_by_date.update(prefetch_weather(
+            config["location"]["latitude"],
+            config["location"]["longitude"],
+            known_dates,
+            config["location"]["timezone"],
+        ))
+
+    # Loop-invariant prompt pieces, built once for the whole inbox
+    categories = config["categories"]
+    cat_prompt = f"Category [{'/'.join(categories)}]: "
+    local_tz = tz.gettz(config["location"]["timezone"])
+
     for idx, image_path in enumerate(image_files, 1):
         print(f"Processing: {image_path.name} ({idx} of {len(image_files)})")
 
         # Get capture date
-        captured_at = get_exif_date(image_path)
+        captured_at = exif_dates.get(image_path)
         if captured_at:
             print(f"Captured: {captured_at.strftime('%Y-%m-%d %H:%M:%S')}")
         else:
             captured_at = prompt_for_date()
 
         # Add timezone info
-        local_tz = tz.gettz(config["location"]["timezone"])
         captured_at = captured_at.replace(tzinfo=local_tz)
 
         print()
 
-        # Build set of existing species names for normalization
-        observations = load_observations()
-        existing_species = set(s["common_name"] for s in sightings)
-        existing_species.update(o["common_name"] for o in observations)
-
         # Collect metadata with validation
         while True:
             common_name_input = input("Common name: ").strip()
@@ -512,10 +926,8 @@ def cmd_add(args):
             print(f"  ✗ {error}")
 
         # Category selection with validation
-        categories = config["categories"]
-        cat_str = "/".join(categories)
         while True:
-            category_input = input(f"Category [{cat_str}]: ").strip()
+            category_input = input(cat_prompt).strip()
             is_valid, category, error = validate_category(category_input, categories)
             if is_valid:
                 break
@@ -535,34 +947,24 @@ def cmd_add(args):
         # ID Certainty (optional)
         print("ID Certainty: [H]igh, [M]edium, [L]ow, or skip")
         certainty_input = input("ID Certainty: ").strip().lower()
-        id_certainty = None
-        if certainty_input in ["h", "high"]:
-            id_certainty = "high"
-        elif certainty_input in ["m", "medium"]:
-            id_certainty = "medium"
-        elif certainty_input in ["l", "low"]:
-            id_certainty = "low"
+        id_certainty = _CERTAINTY_MAP.get(certainty_input)
 
         # Time of day - infer from capture time
         inferred_tod = get_time_of_day(captured_at)
-        times_of_day = ["morning", "afternoon", "evening", "night"]
         tod_input = input(f"Time of day [{inferred_tod}]: ").strip().lower()
-        if tod_input and tod_input in times_of_day:
+        if tod_input and tod_input in TIMES_OF_DAY:
             time_of_day = tod_input
-        elif tod_input and tod_input not in times_of_day:
+        elif tod_input and tod_input not in TIMES_OF_DAY:
             print(f"Invalid. Using inferred: {inferred_tod}")
             time_of_day = inferred_tod
         else:
             time_of_day = inferred_tod
 
         # Tags (comma-separated)
-        existing_tags = set()
-        for s in sightings:
-            existing_tags.update(s.get("tags", []))
         if existing_tags:
-            print(f"Existing tags: {', '.join(sorted(existing_tags))}")
+            print(f"Existing tags: {', '.join(sorted(existing_tags.values()))}")
         tags_input = input("Tags (comma-separated): ").strip()
-        tags = [normalize_name(t, existing_tags) for t in tags_input.split(",") if t.strip()]
+        tags = [normalize_name(t, existing_tags) for t in _COMMA_SPLIT.split(tags_input) if t]
 
         # Collect additional images for same sighting
         images_to_process = [(image_path, "a")]
@@ -575,41 +977,50 @@ def cmd_add(args):
 
             extra_path = input("Image path: ").strip()
             if extra_path and Path(extra_path).exists():
-                letter = chr(ord("a") + letter_idx)
-                images_to_process.append((Path(extra_path), letter))
+                images_to_process.append((Path(extra_path), _seq_to_letter(letter_idx)))
                 letter_idx += 1
             else:
                 print("File not found")
 
         # Generate ID
-        sighting_id = generate_id(captured_at, sightings)
-
-        # Process all images
-        processed_images = []
-        for img_path, letter in images_to_process:
-            filename = process_image(img_path, sighting_id, letter)
-
-            caption = ""
-            if len(images_to_process) > 1:
-                caption = input(f"Caption for {img_path.name} (optional): ").strip()
-
-            processed_images.append({
-                "filename": filename,
-                "caption": caption,
-            })
-
-            # Move original from inbox (if it's in inbox)
-            if img_path.parent == INBOX_PATH:
-                img_path.unlink()
-
-        # Fetch weather
-        print("\nFetching weather data...")
-        weather = fetch_weather(
-            config["location"]["latitude"],
-            config["location"]["longitude"],
-            captured_at,
-            config["location"]["timezone"],
-        )
+        sighting_id = next_sequence_id(captured_at, date_counts)
+
+        # Process all images in the background while captions are
+        # collected - the encodes and uploads overlap the typing
+        with ThreadPoolExecutor(max_workers=min(4, len(images_to_process))) as pool:
+            futures = [
+                pool.submit(process_image, img_path, sighting_id, letter)
+                for img_path, letter in images_to_process
+            ]
+
+            processed_images = []
+            for (img_path, _letter), future in zip(images_to_process, futures):
+                caption = ""
+                if len(images_to_process) > 1:
+                    caption = input(f"Caption for {img_path.name} (optional): ").strip()
+
+                processed_images.append({
+                    "filename": future.result(),
+                    "caption": caption,
+                })
+
+                # Move original from inbox (if it's in inbox)
+                if img_path.parent == INBOX_PATH:
+                    img_path.unlink()
+
+        # Fetch weather - one call per capture date, since daily values
+        # are shared by every image from the same outing
+        date_key = captured_at.strftime("%Y-%m-%d")
+        weather = weather_by_date.get(date_key)
+        if weather is None:
+            print("\nFetching weather data...")
+            weather = fetch_weather(
+                config["location"]["latitude"],
+                config["location"]["longitude"],
+                captured_at,
+                config["location"]["timezone"],
+            )
+            weather_by_date[date_key] = weather
 
         # Calculate celestial data
         moon_data = get_moon_phase(captured_at)
@@ -628,10 +1039,15 @@ def cmd_add(args):
         sighting = {
             "id": sighting_id,
             "images": processed_images,
+            "next_image_seq": len(processed_images),
             "common_name": common_name,
             "scientific_name": scientific_name,
             "category": category,
             "captured_at": captured_at.isoformat(),
+            # Denormalized for readers that only need the day or the
+            # clock time - saves a slice per record per command
+            "date": captured_at.strftime("%Y-%m-%d"),
+            "time": captured_at.strftime("%H:%M"),
             "time_of_day": time_of_day,
             "tags": tags,
             "weather": weather,
@@ -644,7 +1060,9 @@ def cmd_add(args):
         }
 
         sightings.append(sighting)
-        save_sightings(sightings)
+        append_sighting(sighting)
+        existing_species[common_name.casefold()] = common_name
+        existing_tags.update({tag.casefold(): tag for tag in tags})
         added_count += 1
 
         # Print confirmation
@@ -669,7 +1087,7 @@ def cmd_log(args):
     # This handles cases where same common name has multiple scientific names
     species_lookup = {}
     for s in sightings:
-        cn = s["common_name"].lower()
+        cn = s["common_name"].casefold()
         sn = s.get("scientific_name", "")
         if cn not in species_lookup:
             species_lookup[cn] = []
@@ -677,9 +1095,9 @@ def cmd_log(args):
         if entry not in species_lookup[cn]:
             species_lookup[cn].append(entry)
 
-    # Build set of existing species names for normalization
-    existing_species = set(s["common_name"] for s in sightings)
-    existing_species.update(o["common_name"] for o in observations)
+    # Lowercase -> canonical species names for O(1) normalization
+    existing_species = {s["common_name"].casefold(): s["common_name"] for s in sightings}
+    existing_species.update({o["common_name"].casefold(): o["common_name"] for o in observations})
 
     # Get current date/time
     local_tz = tz.gettz(config["location"]["timezone"])
@@ -715,7 +1133,7 @@ def cmd_log(args):
         return
 
     # Parse comma-separated species and normalize names
-    species_list_raw = [s.strip() for s in species_input.split(",") if s.strip()]
+    species_list_raw = [s for s in _COMMA_SPLIT.split(species_input) if s]
     species_list = [normalize_name(s, existing_species) for s in species_list_raw]
 
     if not species_list:
@@ -723,13 +1141,11 @@ def cmd_log(args):
         return
 
     # Time of day (shared for all)
-    times_of_day = ["morning", "afternoon", "evening", "night"]
-    tod_str = "/".join(times_of_day)
     while True:
-        time_of_day = input(f"Time of day [{tod_str}]: ").strip().lower()
-        if time_of_day in times_of_day:
+        time_of_day = input(f"Time of day [{TOD_STR}]: ").strip().lower()
+        if time_of_day in TIMES_OF_DAY:
             break
-        print(f"Invalid. Choose from: {tod_str}")
+        print(f"Invalid. Choose from: {TOD_STR}")
 
     # Fetch weather and celestial data for today (shared for all observations)
     print("Fetching weather data...")
@@ -752,20 +1168,27 @@ def cmd_log(args):
     today_str = now.strftime("%Y-%m-%d")
     sightings_today = set()
     for s in sightings:
-        if s["captured_at"][:10] == today_str:
-            sightings_today.add(s["common_name"].lower())
+        if _sighting_date(s) == today_str:
+            sightings_today.add(s["common_name"].casefold())
+
+    # Per-species totals, counted once instead of rescanning both lists
+    # for every species logged
+    sight_count_by_sci = Counter(s.get("scientific_name", "").lower() for s in sightings)
+    sight_count_by_cn = Counter(s["common_name"].lower() for s in sightings)
+    obs_count_by_sci = Counter(o.get("scientific_name", "").lower() for o in observations)
+    obs_count_by_cn = Counter(o["common_name"].lower() for o in observations)
 
     # Log each species
     print()
     logged_count = 0
     for common_name in species_list:
         # Check if there's already a sighting for this species today
-        if common_name.lower() in sightings_today:
+        if common_name.casefold() in sightings_today:
             print(f"⚠ {common_name} - skipped (already has sighting today)")
             continue
 
         # Check if there are multiple species with this common name
-        cn_lower = common_name.lower()
+        cn_lower = common_name.casefold()
         scientific_name = ""
 
         if cn_lower in species_lookup and len(species_lookup[cn_lower]) > 1:
@@ -802,15 +1225,18 @@ def cmd_log(args):
         }
 
         observations.append(observation)
+        append_observation(observation)
+        obs_count_by_sci[scientific_name.lower()] += 1
+        obs_count_by_cn[common_name.lower()] += 1
         logged_count += 1
 
         # Count total for this species (by scientific name if available, else common name)
         if scientific_name:
-            sighting_count = sum(1 for s in sightings if s.get("scientific_name", "").lower() == scientific_name.lower())
-            observation_count = sum(1 for o in observations if o.get("scientific_name", "").lower() == scientific_name.lower())
+            sighting_count = sight_count_by_sci[scientific_name.lower()]
+            observation_count = obs_count_by_sci[scientific_name.lower()]
         else:
-            sighting_count = sum(1 for s in sightings if s["common_name"].lower() == common_name.lower())
-            observation_count = sum(1 for o in observations if o["common_name"].lower() == common_name.lower())
+            sighting_count = sight_count_by_cn[common_name.lower()]
+            observation_count = obs_count_by_cn[common_name.lower()]
         total_count = sighting_count + observation_count
 
         if scientific_name:
@@ -818,7 +1244,6 @@ def cmd_log(args):
         else:
             print(f"✓ {common_name} (total: {total_count})")
 
-    save_observations(observations)
     skipped = len(species_list) - logged_count
     if skipped:
         print(f"\nLogged {logged_count} observation(s), skipped {skipped} (already had sighting today)")
@@ -834,16 +1259,17 @@ def cmd_list(args):
         print("No sightings yet.")
         return
 
-    # Filter by category or season if specified
-    filtered = sightings
+    # Filter by category or season if specified (lazily - nlargest
+    # consumes the generators without materializing the matches)
+    filtered = iter(sightings)
     if args.category:
-        filtered = [s for s in filtered if s["category"] == args.category]
+        filtered = (s for s in filtered if s["category"] == args.category)
     if args.season:
-        filtered = [s for s in filtered if s["season"] == args.season]
+        filtered = (s for s in filtered if s["season"] == args.season)
 
-    # Sort by date descending and limit
-    filtered = sorted(filtered, key=lambda s: s["captured_at"], reverse=True)
-    filtered = filtered[: args.last]
+    # Top N by date without sorting everything: nlargest keeps a heap
+    # of args.last entries instead of ordering the full history
+    filtered = heapq.nlargest(args.last, filtered, key=lambda s: s["captured_at"])
 
     if not filtered:
         print("No matching sightings found.")
@@ -853,7 +1279,7 @@ def cmd_list(args):
     print("-" * 65)
 
     for s in filtered:
-        date = s["captured_at"][:10]
+        date = _sighting_date(s)
         name = s["common_name"][:24]
         print(f"{s['id']:<15} {date:<12} {name:<25} {s['category']:<10}")
 
@@ -863,13 +1289,8 @@ def cmd_edit(args):
     sightings = load_sightings()
 
     # Find sighting by ID
-    sighting = None
-    sighting_idx = None
-    for idx, s in enumerate(sightings):
-        if s["id"] == args.id:
-            sighting = s
-            sighting_idx = idx
-            break
+    sighting_idx = _index_sightings(sightings).get(args.id)
+    sighting = sightings[sighting_idx] if sighting_idx is not None else None
 
     if not sighting:
         print(f"Sighting {args.id} not found.")
@@ -878,11 +1299,15 @@ def cmd_edit(args):
     print(f"Editing: {sighting['id']} - {sighting['common_name']}")
     print("Press Enter to keep current value.\n")
 
+    # Snapshot to detect a no-op session and skip the file rewrite
+    before = fastjson.dumps(sighting)
+
     config = load_config()
 
     # Edit common name with validation
+    name_prompt = f"Common name [{sighting['common_name']}]: "
     while True:
-        new_name = input(f"Common name [{sighting['common_name']}]: ").strip()
+        new_name = input(name_prompt).strip()
         if not new_name:
             break  # Keep current
         is_valid, normalized, error = validate_common_name(new_name)
@@ -894,8 +1319,9 @@ def cmd_edit(args):
         print(f"  ✗ {error}")
 
     # Edit scientific name with validation
+    sci_prompt = f"Scientific name [{sighting['scientific_name']}]: "
     while True:
-        new_sci = input(f"Scientific name [{sighting['scientific_name']}]: ").strip()
+        new_sci = input(sci_prompt).strip()
         if not new_sci:
             break  # Keep current
         is_valid, normalized, error = validate_scientific_name(new_sci)
@@ -907,9 +1333,9 @@ def cmd_edit(args):
         print(f"  ✗ {error}")
 
     # Edit category with validation
-    cat_str = "/".join(config["categories"])
+    cat_prompt = f"Category [{sighting['category']}] ({'/'.join(config['categories'])}): "
     while True:
-        new_cat = input(f"Category [{sighting['category']}] ({cat_str}): ").strip()
+        new_cat = input(cat_prompt).strip()
         if not new_cat:
             break  # Keep current
         is_valid, normalized, error = validate_category(new_cat, config["categories"])
@@ -936,27 +1362,25 @@ def cmd_edit(args):
     current_certainty = sighting.get('id_certainty', '')
     certainty_display = current_certainty if current_certainty else 'not set'
     print(f"ID Certainty [{certainty_display}]: [H]igh, [M]edium, [L]ow, or skip")
-    new_certainty = input("ID Certainty: ").strip().lower()
-    if new_certainty in ["h", "high"]:
-        sighting["id_certainty"] = "high"
-    elif new_certainty in ["m", "medium"]:
-        sighting["id_certainty"] = "medium"
-    elif new_certainty in ["l", "low"]:
-        sighting["id_certainty"] = "low"
+    new_certainty = _CERTAINTY_MAP.get(input("ID Certainty: ").strip().lower())
+    if new_certainty:
+        sighting["id_certainty"] = new_certainty
 
     # Time of day
     current_tod = sighting.get('time_of_day', '')
-    times_of_day = ["morning", "afternoon", "evening", "night"]
-    tod_str = "/".join(times_of_day)
-    new_tod = input(f"Time of day [{current_tod}] ({tod_str}): ").strip().lower()
-    if new_tod and new_tod in times_of_day:
+    new_tod = input(f"Time of day [{current_tod}] ({TOD_STR}): ").strip().lower()
+    if new_tod and new_tod in TIMES_OF_DAY:
         sighting["time_of_day"] = new_tod
 
     # Tags
     current_tags = ", ".join(sighting.get('tags', []))
     new_tags_input = input(f"Tags [{current_tags}]: ").strip()
     if new_tags_input:
-        sighting["tags"] = [t.strip().lower() for t in new_tags_input.split(",") if t.strip()]
+        sighting["tags"] = [t.lower() for t in _COMMA_SPLIT.split(new_tags_input) if t]
+
+    if fastjson.dumps(sighting) == before:
+        print(f"\nNo changes: {sighting['id']}")
+        return
 
     sightings[sighting_idx] = sighting
     save_sightings(sightings)
@@ -968,13 +1392,8 @@ def cmd_delete(args):
     sightings = load_sightings()
 
     # Find sighting by ID
-    sighting = None
-    sighting_idx = None
-    for idx, s in enumerate(sightings):
-        if s["id"] == args.id:
-            sighting = s
-            sighting_idx = idx
-            break
+    sighting_idx = _index_sightings(sightings).get(args.id)
+    sighting = sightings[sighting_idx] if sighting_idx is not None else None
 
     if not sighting:
         print(f"Sighting {args.id} not found.")
@@ -1004,38 +1423,51 @@ def cmd_delete(args):
     deleted_r2 = []
 
     # Check if R2 is configured
-    try:
-        from r2_upload import is_r2_configured, delete_from_r2
-        r2_enabled = is_r2_configured()
-    except ImportError:
-        r2_enabled = False
-
+    r2 = _r2()
+    r2_enabled = r2 is not None and r2.is_r2_configured()
+
+    # One directory listing per size replaces a stat() per (size, image)
+    # pair when checking what exists locally
+    present = {}
+    for size in ["thumb", "web", "full"]:
+        size_dir = CATALOG_PATH / size
+        present[size] = {e.name for e in os.scandir(size_dir)} if size_dir.is_dir() else set()
+
+    to_unlink = []
+    r2_keys = []
     for img in sighting['images']:
         filename = img['filename']
         for size in ["thumb", "web", "full"]:
-            # Delete local file
-            img_path = CATALOG_PATH / size / filename
-            if img_path.exists():
-                img_path.unlink()
-                deleted_images.append(f"{size}/{filename}")
+            if filename in present[size]:
+                to_unlink.append((CATALOG_PATH / size / filename, f"{size}/{filename}"))
 
-            # Delete from R2
             if r2_enabled:
-                r2_key = f"{size}/{filename}"
-                if delete_from_r2(r2_key):
-                    deleted_r2.append(r2_key)
+                r2_keys.append(f"{size}/{filename}")
+
+    # The unlinks are independent; overlapping them keeps a cold cache
+    # or network filesystem from serializing the waits
+    if to_unlink:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda job: job[0].unlink(), to_unlink))
+        deleted_images = [rel for _, rel in to_unlink]
+
+    # Delete from R2 in one delete_objects round-trip when the module
+    # supports it (the bulk API takes up to 1000 keys per request)
+    # instead of one HTTPS call per key
+    if r2_keys:
+        bulk_delete = getattr(r2, "delete_from_r2_bulk", None)
+        if bulk_delete is not None:
+            deleted_r2 = list(bulk_delete(r2_keys))
+        else:
+            deleted_r2 = [key for key in r2_keys if r2.delete_from_r2(key)]
 
     # Add as observation before deleting (to preserve the record)
-    from datetime import datetime
-    from dateutil import tz as dateutil_tz
-
     config = load_config()
-    local_tz = dateutil_tz.gettz(config["location"]["timezone"])
+    local_tz = tz.gettz(config["location"]["timezone"])
 
     # Extract date/time from sighting
-    captured_at = sighting["captured_at"]
-    sighting_date = captured_at[:10]  # YYYY-MM-DD
-    sighting_time = captured_at[11:16]  # HH:MM
+    sighting_date = _sighting_date(sighting)
+    sighting_time = sighting.get("time") or sighting["captured_at"][11:16]
 
     observation = {
         "date": sighting_date,
@@ -1069,32 +1501,29 @@ def cmd_delete(args):
 
 def cmd_status(args):
     """Show what's been logged today"""
-    from datetime import date
-
     today = date.today().isoformat()
 
     sightings = load_sightings()
     observations = load_observations()
 
-    # Get today's sightings
-    today_sightings = []
-    for s in sightings:
-        if s["captured_at"][:10] == today:
-            today_sightings.append(s["common_name"])
-
-    # Get today's observations
-    today_observations = []
-    for o in observations:
-        if o["date"] == today:
-            today_observations.append(o["common_name"])
+    # Counters give per-species counts in one pass - list.count inside
+    # a loop over the unique names was quadratic. A full scan, not
+    # bisect: backdated imports mean the lists are only mostly sorted,
+    # and loading the file already cost O(N)
+    today_sightings = Counter(
+        s["common_name"] for s in sightings if _sighting_date(s) == today
+    )
+    today_observations = Counter(
+        o["common_name"] for o in observations if o["date"] == today
+    )
 
     print(f"\nToday ({today})")
     print("=" * 40)
 
-    print(f"\nSightings ({len(today_sightings)}):")
+    print(f"\nSightings ({sum(today_sightings.values())}):")
     if today_sightings:
-        for name in sorted(set(today_sightings)):
-            count = today_sightings.count(name)
+        for name in sorted(today_sightings):
+            count = today_sightings[name]
             if count > 1:
                 print(f"  {name} (x{count})")
             else:
@@ -1102,10 +1531,10 @@ def cmd_status(args):
     else:
         print("  (none)")
 
-    print(f"\nObservations ({len(today_observations)}):")
+    print(f"\nObservations ({sum(today_observations.values())}):")
     if today_observations:
-        for name in sorted(set(today_observations)):
-            count = today_observations.count(name)
+        for name in sorted(today_observations):
+            count = today_observations[name]
             if count > 1:
                 print(f"  {name} (x{count})")
             else:
@@ -1128,25 +1557,21 @@ def cmd_stats(args):
     # Basic counts
     total = len(sightings)
 
-    # By category
-    by_category = {}
-    for s in sightings:
-        cat = s["category"]
-        by_category[cat] = by_category.get(cat, 0) + 1
-
-    # By season
-    by_season = {}
+    # One pass covers categories, seasons, species and the date range
+    # (ISO date strings compare chronologically)
+    by_category = Counter()
+    by_season = Counter()
+    species = set()
+    first_date = last_date = None
     for s in sightings:
-        season = s["season"]
-        by_season[season] = by_season.get(season, 0) + 1
-
-    # Date range
-    dates = [s["captured_at"][:10] for s in sightings]
-    first_date = min(dates)
-    last_date = max(dates)
-
-    # Species count (unique common names)
-    species = set(s["common_name"].lower() for s in sightings)
+        by_category[s["category"]] += 1
+        by_season[s["season"]] += 1
+        species.add(s["common_name"].lower())
+        date = _sighting_date(s)
+        if first_date is None or date < first_date:
+            first_date = date
+        if last_date is None or date > last_date:
+            last_date = date
 
     print(f"\n{config['site_title']} - Statistics")
     print("=" * 40)
@@ -1168,11 +1593,8 @@ def cmd_addimage(args):
     sightings = load_sightings()
 
     # Find the sighting
-    sighting = None
-    for s in sightings:
-        if s["id"] == args.id:
-            sighting = s
-            break
+    sighting_idx = _index_sightings(sightings).get(args.id)
+    sighting = sightings[sighting_idx] if sighting_idx is not None else None
 
     if not sighting:
         print(f"Sighting not found: {args.id}")
@@ -1188,14 +1610,13 @@ def cmd_addimage(args):
         print("Only .jpg, .jpeg, and .png files are supported")
         return
 
-    # Determine the next letter for the image
+    # Determine the next suffix from the stored counter; older records
+    # without one fall back to the image count (every image before the
+    # counter existed used a single letter in order)
     existing_images = sighting.get("images", [])
-    if existing_images:
-        # Find the highest letter used
-        last_letter = max(img["filename"].split("-")[-1].split(".")[0] for img in existing_images)
-        next_letter = chr(ord(last_letter) + 1)
-    else:
-        next_letter = "a"
+    seq = sighting.get("next_image_seq", len(existing_images))
+    next_letter = _seq_to_letter(seq)
+    sighting["next_image_seq"] = seq + 1
 
     print(f"Adding image to: {sighting['common_name']} ({args.id})")
     print(f"  Current images: {len(existing_images)}")
@@ -1222,6 +1643,13 @@ def cmd_addimage(args):
     print("Done!")
 
 
+def _run_logweb(args):
+    """Launch the web UI; the import stays lazy so the server stack is
+    only paid for when this command runs."""
+    import logweb
+    logweb.main()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Pipeline CLI for One Square Meter biodiversity project"
@@ -1231,62 +1659,51 @@ def main():
     # add command
     add_parser = subparsers.add_parser("add", help="Add new sightings from inbox")
     add_parser.add_argument("--file", "-f", help="Process specific file instead of inbox")
+    add_parser.set_defaults(func=cmd_add)
 
     # list command
     list_parser = subparsers.add_parser("list", help="List recent sightings")
     list_parser.add_argument("--last", "-n", type=int, default=10, help="Number of entries")
     list_parser.add_argument("--category", "-c", help="Filter by category")
     list_parser.add_argument("--season", "-s", help="Filter by season")
+    list_parser.set_defaults(func=cmd_list)
 
     # edit command
     edit_parser = subparsers.add_parser("edit", help="Edit existing sighting")
     edit_parser.add_argument("id", help="Sighting ID to edit")
+    edit_parser.set_defaults(func=cmd_edit)
 
     # delete command
     delete_parser = subparsers.add_parser("delete", help="Delete a sighting and its images")
     delete_parser.add_argument("id", help="Sighting ID to delete")
     delete_parser.add_argument("--force", "-f", action="store_true", help="Skip confirmation")
+    delete_parser.set_defaults(func=cmd_delete)
 
     # log command
     log_parser = subparsers.add_parser("log", help="Quick log a sighting without images")
     log_parser.add_argument("species", nargs="?", help="Species name (optional, will prompt if not provided)")
+    log_parser.set_defaults(func=cmd_log)
 
     # stats command
-    subparsers.add_parser("stats", help="Show project statistics")
+    subparsers.add_parser("stats", help="Show project statistics").set_defaults(func=cmd_stats)
 
     # status command
-    subparsers.add_parser("status", help="Show what's been logged today")
+    subparsers.add_parser("status", help="Show what's been logged today").set_defaults(func=cmd_status)
 
     # addimage command
     addimage_parser = subparsers.add_parser("addimage", help="Add image to existing sighting")
     addimage_parser.add_argument("id", help="Sighting ID (e.g., 20260101-001)")
     addimage_parser.add_argument("image", help="Path to image file")
     addimage_parser.add_argument("--keep", "-k", action="store_true", help="Keep source file (don't delete)")
+    addimage_parser.set_defaults(func=cmd_addimage)
 
     # logweb command
-    subparsers.add_parser("logweb", help="Open web UI for logging observations")
+    subparsers.add_parser("logweb", help="Open web UI for logging observations").set_defaults(func=_run_logweb)
 
     args = parser.parse_args()
 
-    if args.command == "add":
-        cmd_add(args)
-    elif args.command == "log":
-        cmd_log(args)
-    elif args.command == "list":
-        cmd_list(args)
-    elif args.command == "edit":
-        cmd_edit(args)
-    elif args.command == "delete":
-        cmd_delete(args)
-    elif args.command == "stats":
-        cmd_stats(args)
-    elif args.command == "status":
-        cmd_status(args)
-    elif args.command == "addimage":
-        cmd_addimage(args)
-    elif args.command == "logweb":
-        import logweb
-        logweb.main()
+    if hasattr(args, "func"):
+        args.func(args)
     else:
         parser.print_help()
 
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Upload and delete catalog images on Cloudflare R2.
+
+Credentials come from the environment (.env): R2_ACCOUNT_ID,
+R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY and R2_BUCKET. When any of them
+is missing the pipeline just keeps images local.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import boto3
+from dotenv import load_dotenv
+
+load_dotenv()
+
+R2_ACCOUNT_ID = os.getenv("R2_ACCOUNT_ID", "")
+R2_ACCESS_KEY_ID = os.getenv("R2_ACCESS_KEY_ID", "")
+R2_SECRET_ACCESS_KEY = os.getenv("R2_SECRET_ACCESS_KEY", "")
+R2_BUCKET = os.getenv("R2_BUCKET", "")
+
+
+def is_r2_configured() -> bool:
+    """True when every credential the client needs is present"""
+    return all((R2_ACCOUNT_ID, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY, R2_BUCKET))
+
+
+@lru_cache(maxsize=1)
+def _client():
+    """Build the S3-compatible client once per process"""
+    return boto3.client(
+        "s3",
+        endpoint_url=f"https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com",
+        aws_access_key_id=R2_ACCESS_KEY_ID,
+        aws_secret_access_key=R2_SECRET_ACCESS_KEY,
+    )
+
+
+def upload_to_r2(file_path: Path, key: str) -> bool:
+    """Upload one file under the given key; returns success"""
+    try:
+        _client().upload_file(
+            str(file_path), R2_BUCKET, key,
+            ExtraArgs={"ContentType": "image/jpeg"},
+        )
+        return True
+    except Exception as e:
+        print(f"  R2 upload failed for {key}: {e}")
+        return False
+
+
+def delete_from_r2(key: str) -> bool:
+    """Delete one object; returns success"""
+    try:
+        _client().delete_object(Bucket=R2_BUCKET, Key=key)
+        return True
+    except Exception as e:
+        print(f"  R2 delete failed for {key}: {e}")
+        return False
+
+
+def delete_from_r2_bulk(keys):
+    """Delete many objects in delete_objects batches, yielding the keys
+    that were actually removed.
+
+    The bulk API takes up to 1000 keys per request, so deleting a whole
+    sighting's images is one round-trip instead of one per key.
+    """
+    client = _client()
+    for start in range(0, len(keys), 1000):
+        batch = keys[start:start + 1000]
+        try:
+            response = client.delete_objects(
+                Bucket=R2_BUCKET,
+                Delete={"Objects": [{"Key": k} for k in batch], "Quiet": False},
+            )
+        except Exception as e:
+            print(f"  R2 bulk delete failed: {e}")
+            continue
+        for entry in response.get("Errors", []):
+            print(f"  R2 delete failed for {entry['Key']}: {entry.get('Message', '')}")
+        for entry in response.get("Deleted", []):
+            yield entry["Key"]
@@ -1,15 +1,50 @@
 #!/usr/bin/env python3
 """Regenerate thumbnails and web images from full-size images"""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from PIL import Image
 
 CATALOG_PATH = Path(__file__).parent / "catalog"
 
+
+def _downscale(img, max_width):
+    """Resize to fit max_width (never upscales), preserving aspect ratio"""
+    if img.width <= max_width:
+        return img
+    height = round(img.height * max_width / img.width)
+    return img.resize((max_width, height), Image.LANCZOS)
+
+
+def _process_one(img_path):
+    """Regenerate web + thumb for one full-size image; returns its name.
+
+    Top-level so ProcessPoolExecutor can pickle it.
+    """
+    img = Image.open(img_path)
+
+    # JPEG shrink-on-load: tell the decoder to emit the smallest
+    # DCT scale (1/2, 1/4, 1/8) that still covers 1200px, so a
+    # 24MP original is never fully materialized
+    img.draft("RGB", (1200, 1200))
+
+    if img.mode in ("RGBA", "P"):
+        img = img.convert("RGB")
+
+    # Web: 1200px wide, quality 92
+    web = _downscale(img, 1200)
+    web.save(CATALOG_PATH / "web" / img_path.name, "JPEG", quality=92)
+
+    # Thumbnail: 300px wide, quality 90 - derived from the web
+    # size, not another pass over the decode
+    thumb = _downscale(web, 300)
+    thumb.save(CATALOG_PATH / "thumb" / img_path.name, "JPEG", quality=90)
+
+    return img_path.name
+
+
 def regenerate_images():
     full_dir = CATALOG_PATH / "full"
-    thumb_dir = CATALOG_PATH / "thumb"
-    web_dir = CATALOG_PATH / "web"
 
     if not full_dir.exists():
         print("No full/ directory found")
@@ -18,23 +53,11 @@ def regenerate_images():
     images = list(full_dir.glob("*.jpg"))
     print(f"Regenerating {len(images)} images...")
 
-    for img_path in images:
-        img = Image.open(img_path)
-
-        if img.mode in ("RGBA", "P"):
-            img = img.convert("RGB")
-
-        # Thumbnail: 300px wide, quality 90
-        thumb = img.copy()
-        thumb.thumbnail((300, 10000), Image.LANCZOS)
-        thumb.save(thumb_dir / img_path.name, "JPEG", quality=90)
-
-        # Web: 1200px wide, quality 92
-        web = img.copy()
-        web.thumbnail((1200, 10000), Image.LANCZOS)
-        web.save(web_dir / img_path.name, "JPEG", quality=92)
-
-        print(f"  ✓ {img_path.name}")
+    # Decode+resample is CPU-bound and embarrassingly parallel; one
+    # worker per core, chunked to amortize the task dispatch
+    with ProcessPoolExecutor() as pool:
+        for name in pool.map(_process_one, images, chunksize=4):
+            print(f"  ✓ {name}")
 
     print(f"\nDone! Regenerated {len(images)} thumbnails and web images.")
 
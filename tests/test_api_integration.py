@@ -51,7 +51,7 @@ class TestFetchWeatherAPI:
             }
         }
 
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
             mock_get.return_value.raise_for_status = MagicMock()
@@ -70,7 +70,7 @@ class TestFetchWeatherAPI:
 
     def test_network_timeout(self, sample_coords):
         """Test graceful handling of network timeout"""
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.side_effect = requests.exceptions.Timeout("Connection timed out")
 
             result = fetch_weather(
@@ -88,7 +88,7 @@ class TestFetchWeatherAPI:
 
     def test_connection_error(self, sample_coords):
         """Test graceful handling of connection failure"""
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.side_effect = requests.exceptions.ConnectionError("Failed to connect")
 
             result = fetch_weather(
@@ -103,7 +103,7 @@ class TestFetchWeatherAPI:
 
     def test_http_500_error(self, sample_coords):
         """Test graceful handling of server error"""
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.return_value.status_code = 500
             mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
 
@@ -119,7 +119,7 @@ class TestFetchWeatherAPI:
 
     def test_http_404_error(self, sample_coords):
         """Test graceful handling of not found error"""
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.return_value.status_code = 404
             mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
 
@@ -135,7 +135,7 @@ class TestFetchWeatherAPI:
 
     def test_malformed_json_response(self, sample_coords):
         """Test handling of invalid JSON response"""
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
 
@@ -153,7 +153,7 @@ class TestFetchWeatherAPI:
         """Test handling of response missing expected fields"""
         mock_response = {"hourly": {}}  # Missing "daily" key
 
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -177,7 +177,7 @@ class TestFetchWeatherAPI:
             }
         }
 
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -201,7 +201,7 @@ class TestFetchWeatherAPI:
             }
         }
 
-        with patch('pipeline.requests.get') as mock_get:
+        with patch('pipeline.SESSION.get') as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
             mock_get.return_value.raise_for_status = MagicMock()
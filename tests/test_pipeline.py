@@ -23,8 +23,12 @@ from pipeline import (
     generate_id,
     load_sightings,
     save_sightings,
+    append_sighting,
     load_observations,
     get_moon_phase,
+    _append_record,
+    _seq_to_letter,
+    _date_from_filename,
 )
 
 
@@ -279,6 +283,116 @@ class TestLoadSaveSightings:
                 assert result[0]["common_name"] == "Côte d'Ivoire Beetle"
 
 
+class TestAppendSighting:
+    """Tests for append_sighting and the _append_record splice.
+
+    Appends take the in-place splice path once the file passes 4KB, so
+    the round-trips below cover both the small-file rewrite and the
+    byte-level surgery on a grown file.
+    """
+
+    @staticmethod
+    def _record(i):
+        return {"id": f"20260101-{i:03d}", "common_name": f"Species {i}"}
+
+    def test_append_creates_missing_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sightings.json"
+            with patch('pipeline.SIGHTINGS_PATH', path):
+                append_sighting(self._record(1))
+                assert load_sightings() == [self._record(1)]
+
+    def test_small_file_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sightings.json"
+            with patch('pipeline.SIGHTINGS_PATH', path):
+                expected = []
+                for i in range(5):
+                    append_sighting(self._record(i))
+                    expected.append(self._record(i))
+                assert load_sightings() == expected
+
+    def test_splice_roundtrip_on_large_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sightings.json"
+            # Seed well past the 4KB rewrite threshold so the appends
+            # below definitely take the splice path
+            expected = [self._record(i) for i in range(200)]
+            with patch('pipeline.SIGHTINGS_PATH', path):
+                save_sightings(expected)
+                assert path.stat().st_size > 4096
+                for i in range(200, 210):
+                    append_sighting(self._record(i))
+                    expected.append(self._record(i))
+                assert load_sightings() == expected
+
+    def test_splice_preserves_unicode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sightings.json"
+            expected = [self._record(i) for i in range(200)]
+            with patch('pipeline.SIGHTINGS_PATH', path):
+                save_sightings(expected)
+                append_sighting({"id": "20260101-200", "common_name": "Côte d'Ivoire Beetle"})
+                assert load_sightings()[-1]["common_name"] == "Côte d'Ivoire Beetle"
+
+    def test_splice_output_stays_well_formed(self):
+        # The spliced file must parse with a plain json.loads, not just
+        # the library that wrote it
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sightings.json"
+            with patch('pipeline.SIGHTINGS_PATH', path):
+                save_sightings([self._record(i) for i in range(200)])
+                append_sighting(self._record(200))
+            parsed = json.loads(path.read_text())
+            assert len(parsed) == 201
+
+    def test_non_array_file_raises(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sightings.json"
+            path.write_text("x" * 5000)  # big enough to splice, no bracket
+            with pytest.raises(ValueError):
+                _append_record(path, self._record(0))
+
+
+class TestSeqToLetter:
+    """Tests for _seq_to_letter - image suffixes past the 26th image"""
+
+    def test_first_letters(self):
+        assert _seq_to_letter(0) == "a"
+        assert _seq_to_letter(1) == "b"
+        assert _seq_to_letter(25) == "z"
+
+    def test_rolls_over_past_z(self):
+        assert _seq_to_letter(26) == "aa"
+        assert _seq_to_letter(27) == "ab"
+        assert _seq_to_letter(51) == "az"
+        assert _seq_to_letter(52) == "ba"
+
+    def test_three_letters(self):
+        assert _seq_to_letter(701) == "zz"
+        assert _seq_to_letter(702) == "aaa"
+
+
+class TestDateFromFilename:
+    """Tests for _date_from_filename - the EXIF fast path"""
+
+    def test_timestamped_name_carries_time(self):
+        dt, has_time = _date_from_filename(Path("IMG_20240515_143210.jpg"))
+        assert dt == datetime(2024, 5, 15, 14, 32, 10)
+        assert has_time is True
+
+    def test_date_only_name(self):
+        dt, has_time = _date_from_filename(Path("2024-05-15-ants.jpg"))
+        assert dt == datetime(2024, 5, 15)
+        assert has_time is False
+
+    def test_undated_name(self):
+        assert _date_from_filename(Path("ants.jpg")) == (None, False)
+
+    def test_implausible_date_rejected(self):
+        assert _date_from_filename(Path("IMG_20241341.jpg")) == (None, False)
+
+
 class TestLoadObservations:
     """Tests for load_observations"""
 